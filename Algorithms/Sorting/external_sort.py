@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+'''
+    External merge sort algorithm
+
+    External merge sort sorts data that does not fit in memory.
+
+    It reads the input in chunks small enough to sort in memory, sorts
+    each chunk (in parallel worker processes) and writes each sorted
+    chunk, called a run, to a temporary file as raw fixed width binary
+    records. The runs are then merged together by reading a small block
+    of each file at a time and repeatedly taking the smallest front
+    value with a min heap, so memory stays bounded no matter how large
+    the input is.
+
+    Records are numbers described by an array typecode, for example 'q'
+    for signed 64 bit integers or 'd' for 64 bit floats.
+
+    The merge uses MinBinaryHeap from Data_Structures, so import this
+    module from the repository root as Algorithms.Sorting.external_sort
+'''
+
+
+from array import array
+from itertools import islice
+import os
+import tempfile
+
+from Algorithms.Sorting.radix_sort import radixSortArray
+from Data_Structures.binary_heap import MinBinaryHeap
+
+
+def readRecords(path, typecode='q', bufferSize=65536):
+    '''
+        Streams the records stored in a binary file
+
+        Parameters:
+            path [str]: the file to read
+            typecode [str]: the array typecode of the records
+            bufferSize [int]: the number of records read at a time
+
+        Yields:
+            Each record in the file in order
+    '''
+    with open(path, 'rb') as file:
+        while True:
+            block = array(typecode)
+            try:
+                block.fromfile(file, bufferSize)
+            except EOFError:
+                # fromfile keeps the records it read before running out
+                yield from block
+                return
+            yield from block
+
+
+def writeRecords(records, path, typecode='q', bufferSize=65536):
+    '''
+        Writes records to a binary file a block at a time
+
+        Parameters:
+            records [iterable]: the records to write
+            path [str]: the file to write
+            typecode [str]: the array typecode of the records
+            bufferSize [int]: the number of records written at a time
+    '''
+    records = iter(records)
+    with open(path, 'wb') as file:
+        while True:
+            block = array(typecode, islice(records, bufferSize))
+            if len(block) == 0:
+                return
+            block.tofile(file)
+
+
+def sortChunk(chunk, path):
+    '''
+        Sorts one chunk in memory and writes it to a run file (runs in a
+        worker process)
+
+        Parameters:
+            chunk [array]: the records to sort
+            path [str]: the run file to write
+
+        Returns:
+            The path of the run file
+    '''
+    with open(path, 'wb') as file:
+        radixSortArray(chunk, 16).tofile(file)
+    return path
+
+
+def mergeRuns(paths, typecode='q', bufferSize=65536):
+    '''
+        Merges sorted run files into one sorted stream
+
+        Parameters:
+            paths [list]: the run files to merge
+            typecode [str]: the array typecode of the records
+            bufferSize [int]: the number of records read at a time from
+            each run
+
+        Yields:
+            Every record of every run in sorted order
+
+        K Way Merge:
+        1. Open a reader on each run and put its first record in a min
+        heap along with the index of its run
+        2. Take the smallest record off the heap and yield it
+        3. Replace it with the next record of the same run, or just
+        remove it if that run is finished
+        4. Repeat until the heap is empty
+
+        * Ties go to the earlier run, so the merge is stable
+    '''
+    readers = [readRecords(path, typecode, bufferSize) for path in paths]
+    heap = MinBinaryHeap([])
+    for runIdx, reader in enumerate(readers):
+        for value in reader:
+            heap.insert((value, runIdx))
+            break
+
+    while len(heap.values) > 1:
+        value, runIdx = heap.values[0]
+        nextValue = next(readers[runIdx], None)
+        if nextValue is None:
+            heap.extractMin()
+        else:
+            heap.replaceMin((nextValue, runIdx))
+        yield value
+
+    if len(heap.values) == 1:
+        value, runIdx = heap.extractMin()
+        yield value
+        yield from readers[runIdx]
+
+
+def externalSort(records, typecode='q', chunkSize=1 << 20, processes=None,
+                 maxFanIn=64, bufferSize=65536, tempDir=None):
+    '''
+        Sorts a stream of records that may not fit in memory
+
+        Parameters:
+            records [iterable]: the records to sort (for example a
+            generator, or readRecords over a binary file)
+            typecode [str]: the array typecode of the records
+            chunkSize [int]: the number of records sorted in memory at
+            once by each worker
+            processes [int]: the number of worker processes (defaults to
+            the number of CPUs, 1 sorts in this process)
+            maxFanIn [int]: the most run files merged at once
+            bufferSize [int]: the number of records read or written at a
+            time per file
+            tempDir [str]: where to create the run files (defaults to
+            the system temporary directory)
+
+        Yields:
+            The records in sorted order
+
+        External Sort:
+        1. Read the next chunkSize records into an array
+        2. Send the chunk to a worker process that sorts it with
+        radixSortArray and writes it to a run file, keeping at most two
+        chunks per worker in flight so memory stays bounded
+        3. Repeat until the input is finished
+        4. While there are more than maxFanIn runs, merge groups of
+        maxFanIn runs into longer runs
+        5. Merge the remaining runs and yield the records
+
+        * If the input fits in a single chunk it is sorted in memory and
+        nothing is written to disk
+        * The run files are deleted when the iterator finishes or is
+        closed
+    '''
+    records = iter(records)
+    first = array(typecode, islice(records, chunkSize))
+    second = array(typecode, islice(records, chunkSize))
+    if len(second) == 0:
+        yield from radixSortArray(first, 16)
+        return
+
+    with tempfile.TemporaryDirectory(dir=tempDir) as directory:
+        def chunks():
+            '''
+                Yields each chunk of the input along with its run file
+
+                Yields:
+                    A (chunk, path) pair for each chunk
+            '''
+            chunk = first
+            idx = 0
+            while len(chunk) > 0:
+                yield chunk, os.path.join(directory, 'run{}'.format(idx))
+                chunk = second if idx == 0 else array(
+                    typecode, islice(records, chunkSize))
+                idx += 1
+
+        if processes == 1:
+            paths = [sortChunk(chunk, path) for chunk, path in chunks()]
+        else:
+            from concurrent.futures import ProcessPoolExecutor
+            with ProcessPoolExecutor(max_workers=processes) as executor:
+                limit = 2 * (processes or os.cpu_count() or 1)
+                pending = []
+                paths = []
+                for chunk, path in chunks():
+                    pending.append(executor.submit(sortChunk, chunk, path))
+                    if len(pending) >= limit:
+                        paths.append(pending.pop(0).result())
+                paths.extend(future.result() for future in pending)
+
+        mergeCount = 0
+        maxFanIn = max(2, maxFanIn)
+        while len(paths) > maxFanIn:
+            merged = []
+            for start in range(0, len(paths), maxFanIn):
+                group = paths[start:start + maxFanIn]
+                path = os.path.join(directory, 'merge{}'.format(mergeCount))
+                mergeCount += 1
+                writeRecords(mergeRuns(group, typecode, bufferSize), path,
+                             typecode, bufferSize)
+                for oldPath in group:
+                    os.remove(oldPath)
+                merged.append(path)
+            paths = merged
+
+        yield from mergeRuns(paths, typecode, bufferSize)
@@ -8,6 +8,11 @@
 
     Then each array is merged with each right array in the same function
     call frame until everything is merged in one final pass
+
+    The bottom up version skips the splitting: it sorts small blocks in
+    place and then merges neighboring blocks of doubling width, writing
+    each pass into one preallocated scratch array and swapping the roles
+    of the two arrays between passes
 '''
 
 
@@ -61,6 +66,110 @@ def merge(array1, array2):
     return merged
 
 
+def mergeInto(source, destination, start, mid, end):
+    '''
+        Merges the sorted ranges source[start:mid] and source[mid:end]
+        into destination[start:end] without creating any new lists
+
+        Parameters:
+            source [list]: the array holding the two sorted ranges
+            destination [list]: the array to write the merged range to
+            start [int]: the start of the first range
+            mid [int]: the start of the second range
+            end [int]: the end of the second range
+
+        * Takes from the first range on ties so the sort is stable
+    '''
+    i = start
+    j = mid
+    k = start
+    while i < mid and j < end:
+        if source[j] < source[i]:
+            destination[k] = source[j]
+            j += 1
+        else:
+            destination[k] = source[i]
+            i += 1
+        k += 1
+
+    while i < mid:
+        destination[k] = source[i]
+        i += 1
+        k += 1
+
+    while j < end:
+        destination[k] = source[j]
+        j += 1
+        k += 1
+
+
+def bottomUpMergeSort(array, blockSize=16):
+    '''
+        Sorts an array in place using iterative bottom up merge sort
+        with a single scratch array
+
+        Parameters:
+            array [list]: the array to sort
+            blockSize [int]: the length of the blocks sorted with
+            insertion sort before merging starts
+
+        Returns:
+            The sorted array (the same list that was passed in)
+
+        Bottom Up Merge Sort
+        1. Sort each block of blockSize elements in place with insertion
+        sort
+        2. Allocate one scratch array the same length as the array
+        3. Merge each pair of neighboring blocks from the array into the
+        scratch array, then swap the two so the scratch array becomes
+        the source of the next pass
+        4. Double the block width and repeat until one block covers the
+        whole array
+        5. If the last pass wrote into the scratch array, copy it back
+
+        * Only one extra list is ever allocated, and there is no
+        recursion
+
+        Example (blockSize=1): [10, 24, 76, 73, 72, 1, 9]
+        => Width 1: [10, 24] [73, 76] [1, 72] [9]
+        => Width 2: [10, 24, 73, 76] [1, 9, 72]
+        => Width 4: [1, 9, 10, 24, 72, 73, 76]
+    '''
+    n = len(array)
+    if n < 2:
+        return array
+
+    blockSize = max(1, blockSize)
+    for start in range(0, n, blockSize):
+        end = min(start + blockSize, n)
+        for i in range(start + 1, end):
+            currentVal = array[i]
+            j = i - 1
+            while j >= start and array[j] > currentVal:
+                array[j + 1] = array[j]
+                j -= 1
+            array[j + 1] = currentVal
+
+    source = array
+    destination = [None] * n
+    width = blockSize
+    while width < n:
+        for start in range(0, n, 2 * width):
+            mid = min(start + width, n)
+            end = min(start + 2 * width, n)
+            if mid == end:
+                # The last block has no partner this pass
+                mergeInto(source, destination, start, end, end)
+            else:
+                mergeInto(source, destination, start, mid, end)
+        source, destination = destination, source
+        width *= 2
+
+    if source is not array:
+        array[:] = source
+    return array
+
+
 def mergeSort(array):
     '''
         Sorts an array of integers using merge sort
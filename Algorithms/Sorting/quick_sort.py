@@ -10,9 +10,23 @@
     You do this recursively and thus, every single number eventually
     becomes the pivot (in the correct place) in one of the frames
     such that collapsing all frames into one will have them all in order.
+
+    Intro sort is quick sort with guards against its bad cases: the pivot
+    is a median of sampled elements, elements equal to the pivot are
+    grouped in the middle and never looked at again, small subarrays are
+    finished with insertion sort, and if the partitions keep coming out
+    lopsided the subarray is handed to heap sort, so the worst case is
+    O(nlogn).
 '''
 
 
+import math
+
+
+INSERTION_CUTOFF = 16
+NINTHER_CUTOFF = 40
+
+
 def partition(array, start, end):
     '''
         Selects a pivot and organizes values greater than the pivot
@@ -38,7 +52,7 @@ def partition(array, start, end):
     pivot = array[start]
     swapIdx = start
     i = start + 1
-    while i < len(array):
+    while i <= end:
         if pivot > array[i]:
             swapIdx += 1
             array[i], array[swapIdx] = array[swapIdx], array[i]
@@ -87,3 +101,226 @@ def quickSort(array):
 
     quickSortHelper(array, 0, len(array) - 1)
     return array
+
+
+def medianOfThree(array, a, b, c):
+    '''
+        Finds which of three indices holds the median value
+
+        Parameters:
+            array [list]: the array to look in
+            a [int]: the first index
+            b [int]: the second index
+            c [int]: the third index
+
+        Returns:
+            The index of the median value
+    '''
+    if array[a] < array[b]:
+        if array[b] < array[c]:
+            return b
+        return c if array[a] < array[c] else a
+    if array[a] < array[c]:
+        return a
+    return c if array[b] < array[c] else b
+
+
+def choosePivot(array, start, end):
+    '''
+        Picks a pivot index for array[start:end + 1] that is close to
+        the median
+
+        Parameters:
+            array [list]: the array to sort
+            start [int]: the starting index
+            end [int]: the ending index
+
+        Returns:
+            The pivot index
+
+        * Uses the median of the first, middle and last elements, or
+        for larger subarrays the ninther: the median of the medians of
+        three evenly spaced groups of three
+    '''
+    mid = (start + end) // 2
+    if end - start + 1 < NINTHER_CUTOFF:
+        return medianOfThree(array, start, mid, end)
+
+    step = (end - start + 1) // 8
+    return medianOfThree(
+        array,
+        medianOfThree(array, start, start + step, start + 2 * step),
+        medianOfThree(array, mid - step, mid, mid + step),
+        medianOfThree(array, end - 2 * step, end - step, end)
+    )
+
+
+def threeWayPartition(array, start, end, pivotIdx):
+    '''
+        Partitions array[start:end + 1] into values less than, equal to
+        and greater than the pivot (the Dutch national flag problem)
+
+        Parameters:
+            array [list]: the array to sort
+            start [int]: the starting index
+            end [int]: the ending index
+            pivotIdx [int]: the index of the pivot value
+
+        Returns:
+            A tuple (lt, gt) such that array[lt:gt + 1] holds every value
+            equal to the pivot
+
+        Three Way Partition:
+        1. Keep three regions: less than [start, lt), equal [lt, i) and
+        greater than (gt, end], with [i, gt] not yet looked at
+        2. While i <= gt, look at array[i]
+            a. If it is less than the pivot, swap it to lt and move lt
+            and i forward
+            b. If it is greater than the pivot, swap it to gt and move
+            gt back (the swapped in value has not been looked at yet)
+            c. Otherwise it equals the pivot, so move i forward
+
+        Example: pivot 3 in [3, 5, 3, 1, 3, 2]
+        => [1, 2, 3, 3, 3, 5]
+        => lt = 2, gt = 4
+    '''
+    pivot = array[pivotIdx]
+    lt = start
+    i = start
+    gt = end
+    while i <= gt:
+        value = array[i]
+        if value < pivot:
+            array[lt], array[i] = value, array[lt]
+            lt += 1
+            i += 1
+        elif pivot < value:
+            array[gt], array[i] = value, array[gt]
+            gt -= 1
+        else:
+            i += 1
+    return lt, gt
+
+
+def insertionSortRange(array, start, end):
+    '''
+        Sorts array[start:end + 1] in place using insertion sort
+
+        Parameters:
+            array [list]: the array to sort
+            start [int]: the starting index
+            end [int]: the ending index
+    '''
+    i = start + 1
+    while i <= end:
+        currentVal = array[i]
+        j = i - 1
+        while j >= start and array[j] > currentVal:
+            array[j + 1] = array[j]
+            j -= 1
+        array[j + 1] = currentVal
+        i += 1
+
+
+def heapSortRange(array, start, end):
+    '''
+        Sorts array[start:end + 1] in place using heap sort, treating
+        start as the root of the heap
+
+        Parameters:
+            array [list]: the array to sort
+            start [int]: the starting index
+            end [int]: the ending index
+    '''
+    def siftDown(parent, last):
+        '''
+            Moves the value at heap position parent down until both of
+            its children are smaller, considering positions up to last
+
+            Parameters:
+                parent [int]: the heap position to sift down
+                last [int]: the last heap position in the heap
+        '''
+        value = array[start + parent]
+        child = 2 * parent + 1
+        while child <= last:
+            if child < last and array[start + child] < array[start + child + 1]:
+                child += 1
+            if not value < array[start + child]:
+                break
+            array[start + parent] = array[start + child]
+            parent = child
+            child = 2 * parent + 1
+        array[start + parent] = value
+
+    last = end - start
+    parent = (last - 1) // 2
+    while parent >= 0:
+        siftDown(parent, last)
+        parent -= 1
+
+    while last > 0:
+        array[start], array[start + last] = array[start + last], array[start]
+        last -= 1
+        siftDown(0, last)
+
+
+def introSort(array):
+    '''
+        Sorts an array in place using intro sort, a quick sort that
+        cannot go quadratic
+
+        Parameters:
+            array [list]: the array to sort
+
+        Returns:
+            The sorted array
+
+        Intro Sort:
+        1. Allow 2 * log2(n) levels of partitioning before giving up on
+        quick sort
+        2. While the current subarray is larger than INSERTION_CUTOFF
+            a. If the levels have run out, heap sort the subarray and
+            stop
+            b. Pick a median of three (or ninther) pivot and partition
+            the subarray three ways
+            c. Sort the smaller of the less than / greater than parts
+            with a recursive call and loop on the larger one, so the
+            recursion is at most log2(n) deep
+        3. Finish the remaining small subarray with insertion sort
+
+        * Values equal to the pivot end up in the middle part and are
+        never compared again, so arrays with only a few distinct values
+        sort in about O(n * distinct values) time
+    '''
+    def introSortHelper(array, start, end, depthLimit):
+        '''
+            Sorts array[start:end + 1] with a budget of depthLimit
+            partitioning levels
+
+            Parameters:
+                array [list]: the array to sort
+                start [int]: the starting index
+                end [int]: the ending index
+                depthLimit [int]: the partitioning levels left
+        '''
+        while end - start + 1 > INSERTION_CUTOFF:
+            if depthLimit == 0:
+                heapSortRange(array, start, end)
+                return
+            depthLimit -= 1
+
+            pivotIdx = choosePivot(array, start, end)
+            lt, gt = threeWayPartition(array, start, end, pivotIdx)
+            if lt - start < end - gt:
+                introSortHelper(array, start, lt - 1, depthLimit)
+                start = gt + 1
+            else:
+                introSortHelper(array, gt + 1, end, depthLimit)
+                end = lt - 1
+        insertionSortRange(array, start, end)
+
+    if len(array) > 1:
+        introSortHelper(array, 0, len(array) - 1,
+                        2 * int(math.log2(len(array))))
+    return array
@@ -11,12 +11,26 @@
     Then the array is repopulated in the queue  order of the
     buckets and the digit of interest is shifted left to do
     the same
+
+    The binary version works on 64 bit keys stored in array.array
+    buffers and uses 2^8 (or 2^16) buckets per pass, counting how many
+    keys land in each bucket first so every key can be written straight
+    to its final position. Signed integers and floats are turned into
+    unsigned keys that sort in the same order by flipping bits
 '''
 
 
+from array import array
 import math
 
 
+SIGN_BIT = 1 << 63
+ALL_BITS = (1 << 64) - 1
+SIGNED_TYPECODES = 'bhilq'
+UNSIGNED_TYPECODES = 'BHILQ'
+FLOAT_TYPECODES = 'fd'
+
+
 def getDigit(num, place):
     '''
         Gets the digit in number at a given place value
@@ -96,3 +110,147 @@ def radixSort(array):
             buckets[getDigit(num, place)].append(num)
         array = [num for bucket in buckets for num in bucket]
     return array
+
+
+def toSortableKeys(values, typecode):
+    '''
+        Converts numbers into unsigned 64 bit keys whose order matches
+        the order of the numbers
+
+        Parameters:
+            values [array/list]: the numbers to convert
+            typecode [str]: the array typecode describing the numbers
+
+        Returns:
+            An array('Q') of keys
+
+        * Signed integers: flipping the sign bit moves negative numbers
+        below positive ones
+        * Floats: flipping the sign bit of positive floats and every bit
+        of negative floats makes larger negative magnitudes sort first
+        (-0.0 sorts just before 0.0, NaNs sort at the ends)
+    '''
+    if typecode in FLOAT_TYPECODES:
+        bits = array('Q', array('d', values).tobytes())
+        return array('Q', [bit ^ ALL_BITS if bit & SIGN_BIT else bit | SIGN_BIT
+                           for bit in bits])
+    if typecode in SIGNED_TYPECODES:
+        bits = array('Q', array('q', values).tobytes())
+        return array('Q', [bit ^ SIGN_BIT for bit in bits])
+    return array('Q', values)
+
+
+def fromSortableKeys(keys, typecode):
+    '''
+        Converts keys made by toSortableKeys back into numbers
+
+        Parameters:
+            keys [array]: the keys to convert
+            typecode [str]: the array typecode of the original numbers
+
+        Returns:
+            An array of the original typecode holding the numbers
+    '''
+    if typecode in FLOAT_TYPECODES:
+        bits = array('Q', [key ^ SIGN_BIT if key & SIGN_BIT else key ^ ALL_BITS
+                           for key in keys])
+        return array(typecode, array('d', bits.tobytes()))
+    if typecode in SIGNED_TYPECODES:
+        bits = array('Q', [key ^ SIGN_BIT for key in keys])
+        return array(typecode, array('q', bits.tobytes()))
+    return array(typecode, keys)
+
+
+def radixSortArray(values, radixBits=8, argsort=False):
+    '''
+        Sorts 64 bit integers or floats using least significant digit
+        binary radix sort
+
+        Parameters:
+            values [array/list]: an array.array of numbers, or a list of
+            only ints or only floats
+            radixBits [int]: bits per digit, 8 for 256 buckets or 16 for
+            65536 buckets
+            argsort [bool]: return the sorting permutation instead
+
+        Returns:
+            The sorted numbers (an array of the same typecode, or a list
+            for a list), or if argsort is True an array('q') of indices
+            such that values[indices[0]], values[indices[1]], ... is
+            sorted
+
+        Radix Sort Array:
+        1. Convert every number into an unsigned 64 bit key
+        2. Find the highest bit where the smallest and largest keys
+        differ; every key shares the bits above it, so only the digits
+        below need sorting
+        3. For each digit from least to most significant
+            a. Compute every key's digit and count the keys per bucket
+            b. Skip the pass if all keys land in the same bucket
+            c. Turn the counts into starting positions (a running sum)
+            d. Write each key (and its index for argsort) to its
+            bucket's next position in the other buffer, then swap
+            buffers
+        4. Convert the keys back into numbers
+
+        * Each pass keeps equal digits in their previous order, so the
+        sort (and the permutation) is stable
+        * Raises TypeError for a list mixing ints and floats (converting
+        them to one type could change their values) and OverflowError
+        for ints outside the signed or unsigned 64 bit range
+
+        Example (radixBits=2): [9, 2, 7, 4]
+        => Keys differ in the lowest 4 bits: 2 passes
+        => Digit 0 (bits 0-1): [4, 9, 2, 7]
+        => Digit 1 (bits 2-3): [2, 4, 7, 9]
+    '''
+    if isinstance(values, array):
+        typecode = values.typecode
+    elif any(isinstance(value, float) for value in values):
+        if not all(isinstance(value, float) for value in values):
+            raise TypeError('cannot radix sort a list mixing ints and floats')
+        typecode = 'd'
+    else:
+        typecode = 'q' if any(value < 0 for value in values) else 'Q'
+
+    n = len(values)
+    keys = toSortableKeys(values, typecode)
+    indices = array('q', range(n)) if argsort else None
+    if n > 1:
+        keyBits = (min(keys) ^ max(keys)).bit_length()
+        radix = 1 << radixBits
+        mask = radix - 1
+        scratch = array('Q', bytes(8 * n))
+        scratchIndices = array('q', bytes(8 * n)) if argsort else None
+        for shift in range(0, keyBits, radixBits):
+            digits = [(key >> shift) & mask for key in keys]
+            counts = [0] * radix
+            for digit in digits:
+                counts[digit] += 1
+            if counts[digits[0]] == n:
+                continue
+
+            total = 0
+            for bucket in range(radix):
+                counts[bucket], total = total, total + counts[bucket]
+
+            if argsort:
+                for i, digit in enumerate(digits):
+                    pos = counts[digit]
+                    scratch[pos] = keys[i]
+                    scratchIndices[pos] = indices[i]
+                    counts[digit] = pos + 1
+                indices, scratchIndices = scratchIndices, indices
+            else:
+                for key, digit in zip(keys, digits):
+                    pos = counts[digit]
+                    scratch[pos] = key
+                    counts[digit] = pos + 1
+            keys, scratch = scratch, keys
+
+    if argsort:
+        return indices
+    result = fromSortableKeys(keys, typecode)
+    if isinstance(values, array):
+        return result
+    return result.tolist()
@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+'''
+    Tim sort algorithm
+
+    Tim sort is a hybrid of insertion sort and merge sort that takes
+    advantage of order already present in the data.
+
+    It scans the array for natural runs (stretches that are already
+    ascending, or strictly descending and then reversed), extends short
+    runs to a minimum length with binary insertion sort, and merges the
+    runs pairwise. While merging, once one run keeps winning it switches
+    to galloping: it searches for how far that run keeps winning and
+    copies that whole stretch at once.
+
+    On nearly sorted input there are few runs and galloping copies
+    long stretches, so the sort approaches O(n). It is O(nlogn) in the
+    worst case and stable.
+'''
+
+
+from bisect import bisect_left, bisect_right
+
+
+MIN_GALLOP = 7
+
+
+def minRunLength(n):
+    '''
+        Computes the minimum run length so that n / minRun is a power
+        of 2 or slightly less, which keeps the final merges balanced
+
+        Parameters:
+            n [int]: the length of the array
+
+        Returns:
+            The minimum run length (between 32 and 64 for large arrays)
+    '''
+    remainder = 0
+    while n >= 64:
+        remainder |= n & 1
+        n >>= 1
+    return n + remainder
+
+
+def move(keys, values, start, end, destination):
+    '''
+        Copies keys[start:end] (and the matching values) to begin at
+        destination
+
+        Parameters:
+            keys [list]: the sort keys
+            values [list]: the values moved along with the keys, or None
+            start [int]: the first index to copy
+            end [int]: the index to stop before
+            destination [int]: where the copy starts
+    '''
+    keys[destination:destination + end - start] = keys[start:end]
+    if values is not None:
+        values[destination:destination + end - start] = values[start:end]
+
+
+def countRun(keys, values, start, end):
+    '''
+        Finds the length of the run beginning at start and reverses it
+        in place if it is strictly descending (strictly, so that equal
+        elements never swap and the sort stays stable)
+
+        Parameters:
+            keys [list]: the sort keys
+            values [list]: the values moved along with the keys, or None
+            start [int]: the start of the run
+            end [int]: the end of the array
+
+        Returns:
+            The length of the run
+    '''
+    runEnd = start + 1
+    if runEnd == end:
+        return 1
+    if keys[runEnd] < keys[start]:
+        while runEnd < end and keys[runEnd] < keys[runEnd - 1]:
+            runEnd += 1
+        keys[start:runEnd] = keys[start:runEnd][::-1]
+        if values is not None:
+            values[start:runEnd] = values[start:runEnd][::-1]
+    else:
+        while runEnd < end and keys[runEnd] >= keys[runEnd - 1]:
+            runEnd += 1
+    return runEnd - start
+
+
+def binaryInsertionSort(keys, values, start, end, sortedEnd):
+    '''
+        Extends the sorted range keys[start:sortedEnd] to
+        keys[start:end] by binary searching where each next element
+        goes and shifting the larger ones right with one slice copy
+
+        Parameters:
+            keys [list]: the sort keys
+            values [list]: the values moved along with the keys, or None
+            start [int]: the start of the sorted range
+            end [int]: the end of the range to sort
+            sortedEnd [int]: the end of the part already sorted
+    '''
+    for i in range(sortedEnd, end):
+        key = keys[i]
+
+        # bisect_right places equal keys after the existing ones
+        pos = bisect_right(keys, key, start, i)
+        if pos < i:
+            keys[pos + 1:i + 1] = keys[pos:i]
+            keys[pos] = key
+            if values is not None:
+                value = values[i]
+                values[pos + 1:i + 1] = values[pos:i]
+                values[pos] = value
+
+
+def gallop(keys, x, start, end, right):
+    '''
+        Finds where x belongs in the sorted range keys[start:end] by
+        probing start + 1, start + 3, start + 7, ... and then binary
+        searching the last gap, which is fast when the answer is close
+        to start
+
+        Parameters:
+            keys [list]: the sorted keys to search
+            x [any]: the key to place
+            start [int]: the start of the range
+            end [int]: the end of the range
+            right [bool]: True to place x after equal keys, False before
+
+        Returns:
+            The insertion index of x
+    '''
+    low = start
+    offset = 1
+    while start + offset < end:
+        probe = keys[start + offset - 1]
+        if (probe > x) if right else (probe >= x):
+            break
+        low = start + offset
+        offset *= 2
+    high = min(start + offset, end)
+    if right:
+        return bisect_right(keys, x, low, high)
+    return bisect_left(keys, x, low, high)
+
+
+def mergeRuns(keys, values, start, mid, end):
+    '''
+        Merges the adjacent sorted runs keys[start:mid] and
+        keys[mid:end] in place using galloping
+
+        Parameters:
+            keys [list]: the sort keys
+            values [list]: the values moved along with the keys, or None
+            start [int]: the start of the first run
+            mid [int]: the start of the second run
+            end [int]: the end of the second run
+
+        Merge with galloping:
+        1. Skip the start of the first run that is already not greater
+        than the first element of the second run, and the end of the
+        second run that is already not less than the last element of
+        the first run
+        2. Copy what is left of the first run into a temporary list
+        3. Merge one element at a time, taking from the first run on
+        ties so equal elements keep their order
+        4. Once one run has won MIN_GALLOP times in a row, gallop: find
+        how many elements of each run come next and copy them as slices
+    '''
+    start = gallop(keys, keys[mid], start, mid, True)
+    end = gallop(keys, keys[mid - 1], mid, end, False)
+    if start == mid or mid == end:
+        return
+
+    left = keys[start:mid]
+    leftValues = values[start:mid] if values is not None else None
+    i = 0
+    j = mid
+    k = start
+    leftWins = 0
+    rightWins = 0
+    while i < len(left) and j < end:
+        if keys[j] < left[i]:
+            keys[k] = keys[j]
+            if values is not None:
+                values[k] = values[j]
+            j += 1
+            rightWins += 1
+            leftWins = 0
+        else:
+            keys[k] = left[i]
+            if values is not None:
+                values[k] = leftValues[i]
+            i += 1
+            leftWins += 1
+            rightWins = 0
+        k += 1
+
+        if (leftWins >= MIN_GALLOP or rightWins >= MIN_GALLOP) \
+                and i < len(left) and j < end:
+            # Left elements that are not greater than the next right one
+            count = gallop(left, keys[j], i, len(left), True) - i
+            keys[k:k + count] = left[i:i + count]
+            if values is not None:
+                values[k:k + count] = leftValues[i:i + count]
+            i += count
+            k += count
+            if i < len(left):
+                # Right elements that are less than the next left one
+                count = gallop(keys, left[i], j, end, False) - j
+                move(keys, values, j, j + count, k)
+                j += count
+                k += count
+            leftWins = 0
+            rightWins = 0
+
+    # Any right elements left are already in place
+    keys[k:k + len(left) - i] = left[i:]
+    if values is not None:
+        values[k:k + len(left) - i] = leftValues[i:]
+
+
+def timSort(array, key=None, reverse=False):
+    '''
+        Sorts an array in place using tim sort
+
+        Parameters:
+            array [list]: the array to sort
+            key [function]: computes the value to compare for each
+            element (the element itself by default)
+            reverse [bool]: sort from largest to smallest
+
+        Returns:
+            The sorted array
+
+        Tim Sort:
+        1. Compute the minimum run length from the array length
+        2. Scan the array for the next natural run, reversing it if it
+        is descending
+        3. If the run is shorter than the minimum, extend it with binary
+        insertion sort
+        4. Push the run on a stack and merge the top runs while their
+        lengths break the rules below, so merges stay balanced:
+            a. each run is longer than the next one above it
+            b. each run is longer than the two above it combined
+        5. Repeat from step 2 until the array is scanned, then merge
+        every run left on the stack
+
+        * Sorting with reverse=True reverses the array before and after
+        an ascending sort, which keeps equal elements in their original
+        order
+
+        Example (ignoring the minimum run length):
+        [1, 2, 3, 9, 8, 7, 4, 5, 6]
+        => Runs: [1, 2, 3, 9] [8, 7, 4] [5, 6]
+        => Reverse descending run: [1, 2, 3, 9] [4, 7, 8] [5, 6]
+        => Merging runs: [1, 2, 3, 4, 7, 8, 9] [5, 6]
+        => Merging runs: [1, 2, 3, 4, 5, 6, 7, 8, 9]
+    '''
+    n = len(array)
+    if n < 2:
+        return array
+    if reverse:
+        array.reverse()
+    if key is not None:
+        keys = [key(element) for element in array]
+        values = array
+    else:
+        keys = array
+        values = None
+
+    minRun = minRunLength(n)
+    runs = []
+    start = 0
+    while start < n:
+        runLength = countRun(keys, values, start, n)
+        if runLength < minRun:
+            forced = min(minRun, n - start)
+            binaryInsertionSort(keys, values, start, start + forced,
+                                start + runLength)
+            runLength = forced
+        runs.append([start, runLength])
+        start += runLength
+
+        # Restores the stack invariants by merging neighboring runs
+        while len(runs) > 1:
+            idx = len(runs) - 2
+            if (idx > 0 and runs[idx - 1][1] <= runs[idx][1] + runs[idx + 1][1]) \
+                    or (idx > 1 and runs[idx - 2][1] <= runs[idx - 1][1] + runs[idx][1]):
+                if runs[idx - 1][1] < runs[idx + 1][1]:
+                    idx -= 1
+            elif runs[idx][1] > runs[idx + 1][1]:
+                break
+            mergeRuns(keys, values, runs[idx][0], runs[idx + 1][0],
+                      runs[idx + 1][0] + runs[idx + 1][1])
+            runs[idx][1] += runs[idx + 1][1]
+            del runs[idx + 1]
+
+    while len(runs) > 1:
+        idx = len(runs) - 2
+        if idx > 0 and runs[idx - 1][1] < runs[idx + 1][1]:
+            idx -= 1
+        mergeRuns(keys, values, runs[idx][0], runs[idx + 1][0],
+                  runs[idx + 1][0] + runs[idx + 1][1])
+        runs[idx][1] += runs[idx + 1][1]
+        del runs[idx + 1]
+
+    if reverse:
+        array.reverse()
+    return array
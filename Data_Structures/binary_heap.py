@@ -165,10 +165,31 @@ class MinBinaryHeap:
             self.sinkDown()
         return min
 
+    def replaceMin(self, value):
+        '''
+            Removes the minimum value and inserts a new one with a single
+            sink down, which is cheaper than extractMin() then insert()
+            O(logn)
+
+            Parameters:
+                value [integer]: the value to add to the heap
+
+            Returns:
+                The minimum value before the replacement (None if the
+                heap was empty)
+        '''
+        if len(self.values) == 0:
+            self.values.append(value)
+            return None
+        min = self.values[0]
+        self.values[0] = value
+        self.sinkDown()
+        return min
+
     def sinkDown(self):
         '''
             Sinks down the value replacing the minimum number
-            for the function extractMin()
+            for the functions extractMin() and replaceMin()
         '''
         idx = 0
         length = len(self.values)
@@ -4,11 +4,17 @@
 '''
 
 
+import random
+import time
+
+
 class Node:
     '''
         Node class for binary search tree
     '''
 
+    __slots__ = ('value', 'left', 'right', 'size')
+
     def __init__(self, value, left=None, right=None):
         '''
             Initialization of Node class for the BST
@@ -22,6 +28,13 @@ class Node:
         self.left = left
         self.right = right
 
+        # Number of nodes in the subtree rooted here
+        self.size = 1
+        if left is not None:
+            self.size += left.size
+        if right is not None:
+            self.size += right.size
+
     def __repr__(self):
         '''
             Print representation of a node of the BST
@@ -37,6 +50,9 @@ class BinarySearchTree:
         Binary Search Tree class
     '''
 
+    # Node type created by the bulk constructors
+    nodeClass = Node
+
     def __init__(self, root=None):
         '''
             Initialization of the binary search tree structure
@@ -107,21 +123,28 @@ class BinarySearchTree:
             self.root = newNode
             return self
         else:
+            path = []
             current = self.root
             while True:
                 if value == current.value:
                     return None
+                path.append(current)
                 if value < current.value:
                     if current.left is None:
                         current.left = newNode
-                        return self
+                        break
                     current = current.left
                 else:
                     if current.right is None:
                         current.right = newNode
-                        return self
+                        break
                     current = current.right
 
+            # Every node passed on the way down gains one descendant
+            for node in path:
+                node.size += 1
+            return self
+
     def contains(self, value):
         '''
             Returns whether a value is in the BST
@@ -275,3 +298,595 @@ class BinarySearchTree:
                 traverse(node.right)
         traverse(self.root)
         return data
+
+    # Lazy tree traversals
+    # These use an explicit stack so degenerate trees do not hit the
+    # recursion limit, and yield nodes so callers can stop early
+    def iterBreadthFirst(self):
+        '''
+            Lazily traverses the tree using breadth first search
+            O(n) for a full traversal
+
+            Yields:
+                Each node in the same order as breadthFirstSearch
+        '''
+        if self.root is None:
+            return
+        queue = [self.root]
+        head = 0
+        while head < len(queue):
+            node = queue[head]
+            head += 1
+            yield node
+            if node.left:
+                queue.append(node.left)
+            if node.right:
+                queue.append(node.right)
+
+    def iterPreorder(self):
+        '''
+            Lazily traverses the tree root, left, right
+            O(n) for a full traversal
+
+            Yields:
+                Each node in the same order as depthFirstPreorder
+        '''
+        stack = [self.root] if self.root is not None else []
+        while len(stack):
+            node = stack.pop()
+            yield node
+            if node.right:
+                stack.append(node.right)
+            if node.left:
+                stack.append(node.left)
+
+    def iterInorder(self):
+        '''
+            Lazily traverses the tree left, root, right
+            O(n) for a full traversal
+
+            Yields:
+                Each node in the same order as depthFirstInorder
+        '''
+        stack = []
+        node = self.root
+        while len(stack) or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node
+            node = node.right
+
+    def iterPostorder(self):
+        '''
+            Lazily traverses the tree left, right, root
+            O(n) for a full traversal
+
+            Yields:
+                Each node in the same order as depthFirstPostorder
+        '''
+        stack = []
+        node = self.root
+        lastVisited = None
+        while len(stack) or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            top = stack[-1]
+            if top.right is not None and top.right is not lastVisited:
+                node = top.right
+            else:
+                stack.pop()
+                yield top
+                lastVisited = top
+
+    def height(self):
+        '''
+            Returns the number of levels in the tree
+            O(n)
+
+            Returns:
+                The height of the tree (0 when empty)
+        '''
+        levels = 0
+        level = [self.root] if self.root is not None else []
+        while len(level):
+            levels += 1
+            following = []
+            for node in level:
+                if node.left:
+                    following.append(node.left)
+                if node.right:
+                    following.append(node.right)
+            level = following
+        return levels
+
+    # Order statistics
+    # Every node stores the size of its subtree, so these run in O(h)
+    # (O(logn) on an AVLTree) instead of walking the whole tree
+    def nodeSize(self, node):
+        '''
+            Returns the stored size of a subtree
+
+            Parameters:
+                node [obj]: the root node of the subtree
+
+            Returns:
+                The number of nodes in the subtree (0 for None)
+        '''
+        return node.size if node is not None else 0
+
+    def __len__(self):
+        '''
+            Returns the number of nodes in the tree
+            O(1)
+        '''
+        return self.nodeSize(self.root)
+
+    def rank(self, value):
+        '''
+            Counts the values in the tree smaller than a value
+            O(h)
+
+            Parameters:
+                value [integer]: the value to rank
+
+            Returns:
+                The number of values less than value
+        '''
+        count = 0
+        current = self.root
+        while current is not None:
+            if value <= current.value:
+                current = current.left
+            else:
+                count += self.nodeSize(current.left) + 1
+                current = current.right
+        return count
+
+    def select(self, k):
+        '''
+            Finds the node holding the k-th smallest value
+            O(h)
+
+            Parameters:
+                k [int]: the position of the value, starting from 0
+
+            Returns:
+                The node at that position (None when out of range)
+        '''
+        if k < 0 or k >= len(self):
+            return None
+        current = self.root
+        while current is not None:
+            leftSize = self.nodeSize(current.left)
+            if k < leftSize:
+                current = current.left
+            elif k > leftSize:
+                k -= leftSize + 1
+                current = current.right
+            else:
+                return current
+        return None
+
+    def countRange(self, lo, hi):
+        '''
+            Counts the values between lo and hi inclusive
+            O(h)
+
+            Parameters:
+                lo [integer]: the lower bound
+                hi [integer]: the upper bound
+
+            Returns:
+                The number of values in [lo, hi]
+        '''
+        if hi < lo:
+            return 0
+        count = self.rank(hi) - self.rank(lo)
+        if self.contains(hi):
+            count += 1
+        return count
+
+    def range(self, lo, hi):
+        '''
+            Lazily yields the nodes with values between lo and hi
+            inclusive in sorted order
+            O(h + k) for k nodes yielded
+
+            Parameters:
+                lo [integer]: the lower bound
+                hi [integer]: the upper bound
+
+            Yields:
+                Each node in the range
+        '''
+        # Seeds the stack with the path to lo so that subtrees entirely
+        # below the range are never visited
+        stack = []
+        current = self.root
+        while current is not None:
+            if current.value < lo:
+                current = current.right
+            else:
+                stack.append(current)
+                current = current.left
+        while len(stack):
+            node = stack.pop()
+            if node.value > hi:
+                return
+            yield node
+            current = node.right
+            while current is not None:
+                stack.append(current)
+                current = current.left
+
+    # Bulk construction
+    @classmethod
+    def fromSorted(cls, values):
+        '''
+            Builds a perfectly balanced tree from values in ascending
+            order without going through insert
+            O(n)
+
+            Parameters:
+                values [iterable]: the values in ascending order
+                (repeated values are kept once)
+
+            Returns:
+                The new tree instance
+        '''
+        ordered = []
+        for value in values:
+            if len(ordered) and value <= ordered[-1]:
+                if value == ordered[-1]:
+                    continue
+                raise ValueError('values must be in ascending order')
+            ordered.append(value)
+
+        def build(start, end):
+            '''
+                Builds the subtree for ordered[start:end] with its
+                middle value at the root
+
+                Returns:
+                    The root node of the subtree
+            '''
+            if start >= end:
+                return None
+            mid = (start + end) // 2
+            return cls.nodeClass(
+                ordered[mid], build(start, mid), build(mid + 1, end))
+        return cls(build(0, len(ordered)))
+
+    def merge(self, other):
+        '''
+            Merges the values of two trees into a new balanced tree by
+            walking both in order at the same time
+            O(n + m)
+
+            Parameters:
+                other [obj]: the tree to merge with
+
+            Returns:
+                A new tree of the same type holding the union of values
+        '''
+        def mergedValues():
+            '''
+                Yields the values of both trees in ascending order
+            '''
+            first = self.iterInorder()
+            second = other.iterInorder()
+            a = next(first, None)
+            b = next(second, None)
+            while a is not None and b is not None:
+                if a.value < b.value:
+                    yield a.value
+                    a = next(first, None)
+                elif b.value < a.value:
+                    yield b.value
+                    b = next(second, None)
+                else:
+                    yield a.value
+                    a = next(first, None)
+                    b = next(second, None)
+            while a is not None:
+                yield a.value
+                a = next(first, None)
+            while b is not None:
+                yield b.value
+                b = next(second, None)
+        return type(self).fromSorted(mergedValues())
+
+
+class AVLNode(Node):
+    '''
+        Node class for the AVL tree which also stores the height of
+        its subtree
+    '''
+
+    __slots__ = ('height',)
+
+    def __init__(self, value, left=None, right=None):
+        '''
+            Initialization of Node class for the AVL tree
+
+            Parameters:
+                value [integer]: the value of the node
+                left [obj]: the left child of the node
+                right [obj]: the right child of the node
+        '''
+        Node.__init__(self, value, left, right)
+        self.height = 1 + max(left.height if left is not None else 0,
+                              right.height if right is not None else 0)
+
+
+class AVLTree(BinarySearchTree):
+    '''
+        Self-balancing binary search tree (AVL tree)
+
+        After every insert and remove the heights of the two subtrees of
+        any node differ by at most one, which keeps the height below
+        1.44 * log2(n) even when values arrive in sorted order.
+        contains() and find() are inherited unchanged.
+    '''
+
+    nodeClass = AVLNode
+
+    def nodeHeight(self, node):
+        '''
+            Returns the stored height of a subtree
+
+            Parameters:
+                node [obj]: the root node of the subtree
+
+            Returns:
+                The height of the subtree (0 for None)
+        '''
+        return node.height if node is not None else 0
+
+    def updateNode(self, node):
+        '''
+            Recomputes the height and subtree size of a node from its
+            children
+
+            Parameters:
+                node [obj]: the node to update
+        '''
+        node.height = 1 + max(
+            self.nodeHeight(node.left), self.nodeHeight(node.right))
+        node.size = 1 + self.nodeSize(node.left) + self.nodeSize(node.right)
+
+    def rotateLeft(self, node):
+        '''
+            Rotates a subtree to the left
+
+                node                right
+               |    |              |     |
+              a    right   =>    node    c
+                  |     |       |    |
+                  b     c       a    b
+
+            Parameters:
+                node [obj]: the root node of the subtree
+
+            Returns:
+                The new root node of the subtree
+        '''
+        right = node.right
+        node.right = right.left
+        right.left = node
+        self.updateNode(node)
+        self.updateNode(right)
+        return right
+
+    def rotateRight(self, node):
+        '''
+            Rotates a subtree to the right (mirror of rotateLeft)
+
+            Parameters:
+                node [obj]: the root node of the subtree
+
+            Returns:
+                The new root node of the subtree
+        '''
+        left = node.left
+        node.left = left.right
+        left.right = node
+        self.updateNode(node)
+        self.updateNode(left)
+        return left
+
+    def rebalance(self, node):
+        '''
+            Restores the AVL property at a node whose subtrees may
+            differ in height by two after an insert or remove
+            O(1)
+
+            Parameters:
+                node [obj]: the root node of the subtree
+
+            Returns:
+                The new root node of the subtree
+        '''
+        self.updateNode(node)
+        balance = self.nodeHeight(node.left) - self.nodeHeight(node.right)
+        if balance > 1:
+            if self.nodeHeight(node.left.left) < self.nodeHeight(node.left.right):
+                node.left = self.rotateLeft(node.left)
+            return self.rotateRight(node)
+        if balance < -1:
+            if self.nodeHeight(node.right.right) < self.nodeHeight(node.right.left):
+                node.right = self.rotateRight(node.right)
+            return self.rotateLeft(node)
+        return node
+
+    def retrace(self, path):
+        '''
+            Rebalances every node on a root-to-leaf path from the bottom
+            up and reattaches the rebalanced subtrees to their parents
+            O(logn)
+
+            Parameters:
+                path [list]: the nodes from the root downwards
+        '''
+        for i in range(len(path) - 1, -1, -1):
+            node = path[i]
+            oldHeight = node.height
+            balanced = self.rebalance(node)
+
+            # Ancestors keep their shape once a subtree keeps its
+            # height, but their sizes were already adjusted by the caller
+            if balanced is node and node.height == oldHeight:
+                break
+            if i == 0:
+                self.root = balanced
+            elif path[i - 1].left is node:
+                path[i - 1].left = balanced
+            else:
+                path[i - 1].right = balanced
+
+    def height(self):
+        '''
+            Returns the number of levels in the tree
+            O(1)
+
+            Returns:
+                The height of the tree (0 when empty)
+        '''
+        return self.nodeHeight(self.root)
+
+    def insert(self, value):
+        '''
+            Inserts a node into the AVL tree and rebalances it
+            O(logn)
+
+            Parameters:
+                value [integer]: the value to add to the tree
+
+            Returns:
+                The tree instance (None if the value is already present)
+        '''
+        newNode = AVLNode(value)
+        if self.root is None:
+            self.root = newNode
+            return self
+        path = []
+        current = self.root
+        while current is not None:
+            if value == current.value:
+                return None
+            path.append(current)
+            if value < current.value:
+                current = current.left
+            else:
+                current = current.right
+        if value < path[-1].value:
+            path[-1].left = newNode
+        else:
+            path[-1].right = newNode
+        for node in path:
+            node.size += 1
+        self.retrace(path)
+        return self
+
+    def remove(self, value):
+        '''
+            Removes a value from the AVL tree and rebalances it
+            O(logn)
+
+            Parameters:
+                value [integer]: the value to remove
+
+            Returns:
+                True or False based on whether the value was found
+        '''
+        path = []
+        current = self.root
+        while current is not None and value != current.value:
+            path.append(current)
+            if value < current.value:
+                current = current.left
+            else:
+                current = current.right
+        if current is None:
+            return False
+
+        # A node with two children takes the value of its in-order
+        # successor, which is then removed from the right subtree instead
+        if current.left is not None and current.right is not None:
+            path.append(current)
+            successor = current.right
+            while successor.left is not None:
+                path.append(successor)
+                successor = successor.left
+            current.value = successor.value
+            current = successor
+
+        child = current.left if current.left is not None else current.right
+        if not len(path):
+            self.root = child
+        elif path[-1].left is current:
+            path[-1].left = child
+        else:
+            path[-1].right = child
+        for node in path:
+            node.size -= 1
+        self.retrace(path)
+        return True
+
+
+# Benchmarks
+# Returns its measurements in a dictionary, eg. from the repository
+# root:
+#   python -c "from Data_Structures.binary_search_tree import *;
+#              print(benchmarkBalancedTree())"
+def benchmarkBalancedTree(n=3000, scaling=(10000, 100000), seed=0):
+    '''
+        Compares BinarySearchTree and AVLTree on sorted, reverse sorted
+        and random key streams
+
+        Parameters:
+            n [int]: the number of keys in each stream
+            scaling [tuple]: sizes of sorted streams inserted into an
+            AVLTree to show the cost per insert stays logarithmic
+            seed [int]: seeds the random stream
+
+        Returns:
+            A dictionary mapping each stream to the insert seconds,
+            contains seconds and height of each tree class, plus
+            "scaling": {size: (microseconds per insert, height)}
+    '''
+    keys = list(range(n))
+    shuffled = keys[:]
+    random.Random(seed).shuffle(shuffled)
+    streams = {"sorted": keys, "reverse": keys[::-1], "random": shuffled}
+
+    results = {}
+    for name, stream in streams.items():
+        results[name] = {}
+        for treeClass in (BinarySearchTree, AVLTree):
+            tree = treeClass()
+            started = time.perf_counter()
+            for key in stream:
+                tree.insert(key)
+            insertTime = time.perf_counter() - started
+            started = time.perf_counter()
+            for key in shuffled:
+                tree.contains(key)
+            results[name][treeClass.__name__] = {
+                "insertSeconds": insertTime,
+                "containsSeconds": time.perf_counter() - started,
+                "height": tree.height()
+            }
+
+    results["scaling"] = {}
+    for size in scaling:
+        tree = AVLTree()
+        started = time.perf_counter()
+        for key in range(size):
+            tree.insert(key)
+        results["scaling"][size] = (
+            (time.perf_counter() - started) / size * 1e6, tree.height())
+    return results
@@ -4,11 +4,18 @@
 '''
 
 
+import random
+import time
+import tracemalloc
+
+
 class Node:
     '''
         Linked list node class
     '''
 
+    __slots__ = ('data', 'next', 'prev')
+
     def __init__(self, data, next=None, prev=None):
         '''
             Initialization of doubly linked list node
@@ -242,6 +249,104 @@ class DoublyLinkedList:
         self.length -= 1
         return removeNode
 
+    def __len__(self):
+        '''
+            Returns the length of the linked list
+            O(1)
+        '''
+        return self.length
+
+    def __iter__(self):
+        '''
+            Lazily iterates over the values of the linked list
+            O(n) for a full pass
+
+            Yields:
+                Each value from head to tail
+        '''
+        current = self.head
+        while current:
+            yield current.data
+            current = current.next
+
+    def __reversed__(self):
+        '''
+            Lazily iterates over the values of the linked list backwards
+            O(n) for a full pass
+
+            Yields:
+                Each value from tail to head
+        '''
+        current = self.tail
+        while current:
+            yield current.data
+            current = current.prev
+
+    def slice(self, start, stop=None):
+        '''
+            Lazily iterates over the values in positions [start, stop)
+            without copying the list, starting from the closer end
+            O(min(start, n - start) + k) for k values
+
+            Parameters:
+                start [int]: the first position
+                stop [int]: the position to stop before (None for the end)
+
+            Yields:
+                Each value in the range
+        '''
+        if stop is None or stop > self.length:
+            stop = self.length
+        if start < 0 or start >= stop:
+            return
+        current = self.get(start)
+        for _ in range(stop - start):
+            yield current.data
+            current = current.next
+
+    def extend(self, items):
+        '''
+            Pushes several values, building their nodes into a chain
+            first and linking it to the tail once
+            O(k)
+
+            Parameters:
+                items [iterable]: the values to add in order
+
+            Returns:
+                The linked list instance
+        '''
+        chain = DoublyLinkedList()
+        for data in items:
+            chain.push(data)
+        return self.splice(chain)
+
+    def splice(self, other):
+        '''
+            Moves every node of another linked list onto the end of this
+            one by relinking, leaving the other list empty
+            O(1)
+
+            Parameters:
+                other [obj]: the DoublyLinkedList to append
+
+            Returns:
+                The linked list instance
+        '''
+        if other is self or other.head is None:
+            return self
+        if self.head is None:
+            self.head = other.head
+        else:
+            self.tail.next = other.head
+            other.head.prev = self.tail
+        self.tail = other.tail
+        self.length += other.length
+        other.head = None
+        other.tail = None
+        other.length = 0
+        return self
+
     def print_reverse(self):
         '''
             Prints the doubly linked list in reverse
@@ -269,3 +374,403 @@ class DoublyLinkedList:
             list.append(current.data)
             current = current.next
         return '{}'.format(list)
+
+
+class UnrolledNode:
+    '''
+        Unrolled linked list node class holding a chunk of values
+    '''
+
+    __slots__ = ('values', 'next', 'prev')
+
+    def __init__(self, values=None, next=None, prev=None):
+        '''
+            Initialization of unrolled linked list node
+            O(1)
+
+            Parameters:
+                values [list]: the values stored in the node
+                next [obj]: the next node
+                prev [obj]: the previous node
+        '''
+        self.values = values if values is not None else []
+        self.next = next
+        self.prev = prev
+
+    def __repr__(self):
+        '''
+            Print representation of the UnrolledNode class
+
+            Returns:
+                The string representation of the chunk
+        '''
+        return '{}'.format(self.values)
+
+
+class UnrolledDoublyLinkedList:
+    '''
+        Doubly linked list that stores up to chunkSize values per node
+
+        Keeping values together in small arrays cuts the per-value node
+        overhead and lets get() skip a whole chunk per step. Nodes are
+        split when they overflow and merged with a neighbor when they
+        fall below half full. The methods match DoublyLinkedList but
+        return values rather than nodes, since values have no node of
+        their own.
+    '''
+
+    def __init__(self, chunkSize=64):
+        '''
+            Initialization of unrolled doubly linked list instance
+            O(1)
+
+            Parameters:
+                chunkSize [int]: the most values stored in one node
+        '''
+        self.head = None
+        self.tail = None
+        self.length = 0
+        self.chunkSize = max(chunkSize, 2)
+
+    def locate(self, index):
+        '''
+            Finds the node holding a position, walking from whichever
+            end of the list is closer
+            O(n / chunkSize)
+
+            Parameters:
+                index [integer]: the position to find
+
+            Returns:
+                A tuple of the node and the offset inside its chunk
+        '''
+        if index <= self.length // 2:
+            current = self.head
+            while index >= len(current.values):
+                index -= len(current.values)
+                current = current.next
+            return current, index
+        index = self.length - 1 - index
+        current = self.tail
+        while index >= len(current.values):
+            index -= len(current.values)
+            current = current.prev
+        return current, len(current.values) - 1 - index
+
+    def linkAfter(self, node, newNode):
+        '''
+            Links a new node after node (or as the head when node is
+            None)
+
+            Parameters:
+                node [obj]: the node to link after
+                newNode [obj]: the node to link in
+        '''
+        if node is None:
+            newNode.next = self.head
+            if self.head is not None:
+                self.head.prev = newNode
+            self.head = newNode
+            if self.tail is None:
+                self.tail = newNode
+            return
+        newNode.prev = node
+        newNode.next = node.next
+        if node.next is not None:
+            node.next.prev = newNode
+        else:
+            self.tail = newNode
+        node.next = newNode
+
+    def unlink(self, node):
+        '''
+            Removes a node from the chain of nodes
+
+            Parameters:
+                node [obj]: the node to remove
+        '''
+        if node.prev is not None:
+            node.prev.next = node.next
+        else:
+            self.head = node.next
+        if node.next is not None:
+            node.next.prev = node.prev
+        else:
+            self.tail = node.prev
+        node.next = None
+        node.prev = None
+
+    def shrink(self, node):
+        '''
+            Unlinks an empty node or merges a node that fell below half
+            full into its next neighbor when they fit in one chunk
+
+            Parameters:
+                node [obj]: the node that lost a value
+        '''
+        if not len(node.values):
+            self.unlink(node)
+            return
+        following = node.next
+        if len(node.values) < self.chunkSize // 2 and following is not None \
+                and len(node.values) + len(following.values) <= self.chunkSize:
+            node.values.extend(following.values)
+            self.unlink(following)
+
+    def push(self, data):
+        '''
+            Inserts a value at the end of the linked list
+            O(1)
+
+            Parameters:
+                data [integer]: the value to add
+
+            Returns:
+                The linked list instance
+        '''
+        if self.tail is None or len(self.tail.values) >= self.chunkSize:
+            self.linkAfter(self.tail, UnrolledNode())
+        self.tail.values.append(data)
+        self.length += 1
+        return self
+
+    def pop(self):
+        '''
+            Removes a value from the end of the linked list
+            O(1)
+
+            Returns:
+                The value that was removed
+        '''
+        if self.tail is None:
+            return None
+        node = self.tail
+        data = node.values.pop()
+        if not len(node.values):
+            self.unlink(node)
+        self.length -= 1
+        return data
+
+    def shift(self):
+        '''
+            Removes a value from the beginning of the linked list
+            O(chunkSize)
+
+            Returns:
+                The value that was removed
+        '''
+        if self.head is None:
+            return None
+        node = self.head
+        data = node.values.pop(0)
+        if not len(node.values):
+            self.unlink(node)
+        self.length -= 1
+        return data
+
+    def unshift(self, data):
+        '''
+            Adds a value at the beginning of the linked list
+            O(chunkSize)
+
+            Parameters:
+                data [integer]: the value to add
+
+            Returns:
+                The linked list instance
+        '''
+        if self.head is None or len(self.head.values) >= self.chunkSize:
+            self.linkAfter(None, UnrolledNode())
+        self.head.values.insert(0, data)
+        self.length += 1
+        return self
+
+    def get(self, index):
+        '''
+            Accesses a value in the linked list by its position
+            O(n / chunkSize)
+
+            Parameters:
+                index [integer]: the index to get the value of
+
+            Returns:
+                The value at the specified index
+        '''
+        if index < 0 or index >= self.length:
+            return None
+        node, offset = self.locate(index)
+        return node.values[offset]
+
+    def set(self, index, data):
+        '''
+            Replaces the value at a specified position
+            O(n / chunkSize)
+
+            Parameters:
+                index [integer]: the index to set the value of
+                data [integer]: the new value of the index
+
+            Returns:
+                True or False based on set success
+        '''
+        if index < 0 or index >= self.length:
+            return False
+        node, offset = self.locate(index)
+        node.values[offset] = data
+        return True
+
+    def insert(self, index, data):
+        '''
+            Adds a new value at a specified position in the linked list
+            O(n / chunkSize + chunkSize)
+
+            Parameters:
+                index [integer]: the index to insert to
+                data [integer]: the value to insert
+
+            Returns:
+                True or False on insertion success
+        '''
+        if index < 0 or index > self.length:
+            return False
+        if index == self.length:
+            self.push(data)
+            return True
+
+        node, offset = self.locate(index)
+        node.values.insert(offset, data)
+
+        # Splits an overflowing chunk in half
+        if len(node.values) > self.chunkSize:
+            half = len(node.values) // 2
+            self.linkAfter(node, UnrolledNode(node.values[half:]))
+            del node.values[half:]
+        self.length += 1
+        return True
+
+    def remove(self, index):
+        '''
+            Removes the value at a specific position in the linked list
+            O(n / chunkSize + chunkSize)
+
+            Parameters:
+                index [integer]: the index of the value to remove
+
+            Returns:
+                The value that is removed
+        '''
+        if index < 0 or index >= self.length:
+            return None
+        node, offset = self.locate(index)
+        data = node.values.pop(offset)
+        self.shrink(node)
+        self.length -= 1
+        return data
+
+    def __len__(self):
+        '''
+            Returns the length of the linked list
+            O(1)
+        '''
+        return self.length
+
+    def __iter__(self):
+        '''
+            Lazily iterates over the values of the linked list
+            O(n) for a full pass
+
+            Yields:
+                Each value from head to tail
+        '''
+        current = self.head
+        while current:
+            yield from current.values
+            current = current.next
+
+    def __reversed__(self):
+        '''
+            Lazily iterates over the values of the linked list backwards
+            O(n) for a full pass
+
+            Yields:
+                Each value from tail to head
+        '''
+        current = self.tail
+        while current:
+            yield from reversed(current.values)
+            current = current.prev
+
+    def print_reverse(self):
+        '''
+            Prints the doubly linked list in reverse
+
+            Returns:
+                The reversed linked list
+        '''
+        list = []
+        current = self.tail
+        while current:
+            list.extend(reversed(current.values))
+            current = current.prev
+        return list
+
+    def __repr__(self):
+        '''
+            Print representation of unrolled doubly linked list
+
+            Returns:
+                The string format of the linked list
+        '''
+        list = []
+        current = self.head
+        while current:
+            list.extend(current.values)
+            current = current.next
+        return '{}'.format(list)
+
+
+# Benchmarks
+# Returns its measurements in a dictionary, eg. from the repository
+# root:
+#   python -c "from Data_Structures.doubly_linked_list import *;
+#              print(benchmarkUnrolledList())"
+def benchmarkUnrolledList(n=200000, gets=200, seed=0):
+    '''
+        Compares the memory, iteration speed and random access speed of
+        DoublyLinkedList and UnrolledDoublyLinkedList
+
+        Parameters:
+            n [int]: the number of values in each list
+            gets [int]: the number of random get() calls to time
+            seed [int]: seeds the random indexes
+
+        Returns:
+            A dictionary mapping each class name to its bytes per
+            element (including the int values), milliseconds for a full
+            iteration and microseconds per random get
+    '''
+    generator = random.Random(seed)
+    indexes = [generator.randrange(n) for _ in range(gets)]
+    results = {}
+    for listClass in (DoublyLinkedList, UnrolledDoublyLinkedList):
+        tracemalloc.start()
+        values = listClass()
+        for value in range(1000, 1000 + n):
+            values.push(value)
+        allocated = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        started = time.perf_counter()
+        for _ in values:
+            pass
+        iteration = time.perf_counter() - started
+
+        started = time.perf_counter()
+        for idx in indexes:
+            values.get(idx)
+        results[listClass.__name__] = {
+            "bytesPerElement": allocated / n,
+            "iterationMilliseconds": iteration * 1e3,
+            "getMicroseconds": (time.perf_counter() - started) / gets * 1e6
+        }
+    return results
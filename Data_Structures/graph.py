@@ -11,6 +11,14 @@
 '''
 
 
+from array import array
+import json
+import os
+import random
+import tempfile
+import time
+
+
 class Graph:
     '''
         Graph data structure class (Undirected Graph)
@@ -46,6 +54,21 @@ class Graph:
         self.adjacencyList[vertex1].append(vertex2)
         self.adjacencyList[vertex2].append(vertex1)
 
+    def hasEdge(self, vertex1, vertex2):
+        '''
+            Returns whether an edge is in the graph
+            O(degree)
+
+            Parameters:
+                vertex1 [string, int]: one end of the edge
+                vertex2 [string, int]: the other end of the edge
+
+            Returns:
+                True or False based on whether the edge is found
+        '''
+        neighbors = self.adjacencyList.get(vertex1)
+        return neighbors is not None and vertex2 in neighbors
+
     def removeEdge(self, vertex1, vertex2):
         '''
             Removes an edge from the adjacency list graph
@@ -141,19 +164,132 @@ class Graph:
                 An array showing the traversal order
         '''
         queue = [start]
-        results = []
         visited = {}
         visited[start] = True
+        head = 0
 
-        while len(queue):
-            currentVertex = queue.pop(0)
-            results.append(currentVertex)
+        # Reads the queue with a moving head index since pop(0) shifts
+        # the whole list and makes the traversal O(V^2)
+        while head < len(queue):
+            currentVertex = queue[head]
+            head += 1
 
             for neighbor in self.adjacencyList[currentVertex]:
                 if not visited.get(neighbor):
                     visited[neighbor] = True
                     queue.append(neighbor)
-        return results
+        return queue
+
+    def iterDepthFirst(self, start):
+        '''
+            Lazily traverses the graph via depth first traversal in the
+            same order as depthFirstRec, using an explicit stack of
+            neighbor iterators instead of recursion so long chains do
+            not hit the recursion limit
+
+            Parameters:
+                start [string]: the starting point of the traversal
+
+            Yields:
+                Each vertex as it is visited
+        '''
+        visited = {start: True}
+        stack = [iter(self.adjacencyList[start])]
+        yield start
+        while len(stack):
+            for neighbor in stack[-1]:
+                if not visited.get(neighbor):
+                    visited[neighbor] = True
+                    yield neighbor
+                    stack.append(iter(self.adjacencyList[neighbor]))
+                    break
+            else:
+                stack.pop()
+
+    def iterBreadthFirst(self, start):
+        '''
+            Lazily traverses the graph using breadth first search in the
+            same order as breadthFirst
+
+            Parameters:
+                start [string]: The starting key to use for traversal
+
+            Yields:
+                Each vertex as it is visited
+        '''
+        queue = [start]
+        visited = {start: True}
+        head = 0
+        while head < len(queue):
+            currentVertex = queue[head]
+            head += 1
+            yield currentVertex
+
+            for neighbor in self.adjacencyList[currentVertex]:
+                if not visited.get(neighbor):
+                    visited[neighbor] = True
+                    queue.append(neighbor)
+
+
+class HashedGraph(Graph):
+    '''
+        Graph data structure class (Undirected Graph) whose adjacency
+        list maps each vertex to a dictionary of its neighbors
+
+        The dictionaries keep insertion order so traversals visit
+        neighbors in the same order as Graph, while adding, removing and
+        testing an edge are hash lookups (hasEdge is inherited from Graph
+        and is O(1) here). Repeated edges are stored once.
+    '''
+
+    def addVertex(self, vertex):
+        '''
+            Adds a vertex to the adjacency list graph
+            O(1)
+
+            Parameters:
+                vertex [string]: the key of the new vertex
+        '''
+        if vertex not in self.adjacencyList:
+            self.adjacencyList[vertex] = {}
+
+    def addEdge(self, vertex1, vertex2):
+        '''
+            Adds an edge to the adjacency list graph if it is not
+            already there
+            O(1)
+
+            Parameters:
+                vertex1 [string, int]: one end of the edge
+                vertex2 [string, int]: the other end of the edge
+        '''
+        self.adjacencyList[vertex1][vertex2] = True
+        self.adjacencyList[vertex2][vertex1] = True
+
+    def removeEdge(self, vertex1, vertex2):
+        '''
+            Removes an edge from the adjacency list graph
+            O(1)
+
+            Parameters:
+                vertex1 [string, int]: one end of the edge
+                vertex2 [string, int]: the other end of the edge
+        '''
+        self.adjacencyList[vertex1].pop(vertex2, None)
+        self.adjacencyList[vertex2].pop(vertex1, None)
+
+    def removeVertex(self, vertex):
+        '''
+            Removes a vertex from the adjacency list graph
+            O(degree)
+
+            Parameters:
+                vertex [string]: the vertex to remove
+        '''
+        for neighbor in self.adjacencyList[vertex]:
+            if neighbor != vertex:
+                del self.adjacencyList[neighbor][vertex]
+        del self.adjacencyList[vertex]
 
 
 class DijkstraPriorityQueueNaive:
@@ -197,6 +333,8 @@ class Node:
         Priority queue node class
     '''
 
+    __slots__ = ('val', 'priority')
+
     def __init__(self, value, priority):
         '''
             Initialization of priority queue node
@@ -313,6 +451,224 @@ class DijkstraPriorityQueue:
             idx = swap
 
 
+class IndexedPriorityQueue:
+    '''
+        Priority queue class using MinBinaryHeap structure with a
+        position map from each value to its index in the heap
+
+        Every value is stored at most once, so lowering the priority of
+        a value already in the queue moves its node up the heap instead
+        of enqueueing a duplicate
+    '''
+
+    def __init__(self):
+        '''
+            Initialization of indexed priority queue class
+        '''
+        self.values = []
+        self.positions = {}
+
+    def __repr__(self):
+        '''
+            Print representation of binary heap structure
+
+            Returns:
+                The string format of the heap
+        '''
+        return '{}'.format(self.values)
+
+    def __contains__(self, value):
+        '''
+            Returns whether a value is currently in the queue
+            O(1)
+
+            Parameters:
+                value [string, int]: the value to look up
+
+            Returns:
+                True or False based on whether the value is queued
+        '''
+        return value in self.positions
+
+    def enqueue(self, value, priority):
+        '''
+            Inserts a value into the binary heap, or lowers its priority
+            if it is already queued with a higher one
+            O(logn)
+
+            Parameters:
+                value [string, int]: the value of the node added
+                priority [int]: the priority of the node added
+        '''
+        if value in self.positions:
+            self.decreaseKey(value, priority)
+            return
+        self.values.append(Node(value, priority))
+        self.positions[value] = len(self.values) - 1
+        self.bubbleUp(len(self.values) - 1)
+
+    def decreaseKey(self, value, priority):
+        '''
+            Lowers the priority of a queued value
+            O(logn)
+
+            Parameters:
+                value [string, int]: the value already in the queue
+                priority [int]: the new priority of the value
+
+            Returns:
+                True or False based on whether the priority was lowered
+        '''
+        idx = self.positions[value]
+        if priority >= self.values[idx].priority:
+            return False
+        self.values[idx].priority = priority
+        self.bubbleUp(idx)
+        return True
+
+    def bubbleUp(self, idx):
+        '''
+            Bubbles a node into position after insertion or after its
+            priority has been lowered
+
+            Parameters:
+                idx [int]: the heap index of the node to move
+        '''
+        element = self.values[idx]
+        while idx > 0:
+            parentIdx = (idx - 1) // 2
+            parent = self.values[parentIdx]
+            if element.priority >= parent.priority:
+                break
+            self.values[idx] = parent
+            self.positions[parent.val] = idx
+            idx = parentIdx
+        self.values[idx] = element
+        self.positions[element.val] = idx
+
+    def dequeue(self):
+        '''
+            Removes the min value of the binary heap
+            (ie. removes the root of the binary heap)
+            O(logn)
+
+            Returns:
+                The minimum value
+        '''
+        if len(self.values) == 0:
+            return None
+        min = self.values[0]
+        del self.positions[min.val]
+        end = self.values.pop()
+        if len(self.values) > 0:
+            self.values[0] = end
+            self.positions[end.val] = 0
+            self.sinkDown()
+        return min
+
+    def sinkDown(self):
+        '''
+            Sinks down the value replacing the minimum number
+            for the function dequeue()
+        '''
+        idx = 0
+        length = len(self.values)
+        element = self.values[0]
+        while True:
+            leftChildIdx = 2 * idx + 1
+            rightChildIdx = 2 * idx + 2
+            swap = None
+            if leftChildIdx < length:
+                leftChild = self.values[leftChildIdx]
+                if leftChild.priority < element.priority:
+                    swap = leftChildIdx
+            if rightChildIdx < length:
+                rightChild = self.values[rightChildIdx]
+                if (swap is None and rightChild.priority < element.priority) or (
+                        swap is not None and rightChild.priority < leftChild.priority):
+                    swap = rightChildIdx
+            if swap is None:
+                break
+
+            self.values[idx] = self.values[swap]
+            self.positions[self.values[idx].val] = idx
+            idx = swap
+        self.values[idx] = element
+        self.positions[element.val] = idx
+
+
+class ShortestPathTree:
+    '''
+        Shortest path tree produced by WeightedGraph.shortestPathTree
+        Holds the final distance and previous vertex of every settled
+        vertex so paths can be rebuilt without another search
+    '''
+
+    def __init__(self, start):
+        '''
+            Initialization of the shortest path tree
+
+            Parameters:
+                start [string]: the root vertex of the tree
+        '''
+        self.start = start
+        self.distances = {}
+        self.previous = {}
+
+    def __repr__(self):
+        '''
+            Print representation of the shortest path tree
+
+            Returns:
+                The string format of the settled distances
+        '''
+        return '{}'.format(self.distances)
+
+    def __contains__(self, vertex):
+        '''
+            Returns whether a vertex was settled by the search
+
+            Parameters:
+                vertex [string]: the vertex to check
+        '''
+        return vertex in self.distances
+
+    def distanceTo(self, target):
+        '''
+            Returns the shortest distance from the root to a vertex
+            O(1)
+
+            Parameters:
+                target [string]: the destination vertex
+
+            Returns:
+                The distance, or infinity if the vertex was not settled
+        '''
+        return self.distances.get(target, float("inf"))
+
+    def pathTo(self, target):
+        '''
+            Rebuilds the shortest path from the root to a vertex
+            O(path length)
+
+            Parameters:
+                target [string]: the destination vertex
+
+            Returns:
+                The list of vertices from the root to target (empty if
+                the vertex was not settled)
+        '''
+        path = []
+        if target not in self.distances:
+            return path
+        current = target
+        while current is not None:
+            path.append(current)
+            current = self.previous[current]
+        path.reverse()
+        return path
+
+
 class WeightedGraph:
     '''
         Graph with weight values on each edge relationship
@@ -351,54 +707,1072 @@ class WeightedGraph:
         '''
             Performs Dijkstra's shortest path algorithm to find the
             shortest path between the start and finish nodes
+            O((V + E)logV)
         '''
-        nodes = DijkstraPriorityQueue()
+        return self.shortestPathTree(start, [finish]).pathTo(finish)
+
+    def shortestPathTree(self, start, targets=None):
+        '''
+            Runs Dijkstra's algorithm from start and keeps the distance
+            and previous vertex of everything it settles
+            O((V + E)logV)
+
+            Parameters:
+                start [string]: the starting vertex
+                targets [iterable]: optional vertices to stop at; the
+                search ends as soon as all of them are settled instead
+                of covering the whole graph
+
+            Returns:
+                A ShortestPathTree rooted at start
+        '''
+        nodes = IndexedPriorityQueue()
         distances = {}
         previous = {}
-        path = []
+        tree = ShortestPathTree(start)
+        if start not in self.adjacencyList:
+            return tree
+        remaining = None
+        if targets is not None:
+            remaining = set(targets)
 
         # Initial state
-        # Starts the starting node at 0 distance and all others at infinity (ie
-        # unknown distance)
-        for vertex in self.adjacencyList:
-            if vertex == start:
-                distances[vertex] = 0
-                nodes.enqueue(vertex, 0)
-            else:
-                distances[vertex] = float("inf")
-            previous[vertex] = None
+        # Starts the starting node at 0 distance and all others are
+        # treated as infinity (ie unknown distance) until reached
+        distances[start] = 0
+        previous[start] = None
+        nodes.enqueue(start, 0)
 
         # While there are vertices to visit
         while len(nodes.values):
 
             # Grabs the current smallest distance from priority queue
+            # Its distance can no longer improve so it joins the tree
             smallest = nodes.dequeue().val
-            if smallest == finish:
-                # Build shortest path from start to finish in reverse order
-                # from finish
-                while smallest is not None:
-                    path.append(smallest)
-                    smallest = previous[smallest]
+            tree.distances[smallest] = distances[smallest]
+            tree.previous[smallest] = previous[smallest]
+            if remaining is not None:
+                remaining.discard(smallest)
+                if not remaining:
+                    break
+
+            for neighbor in self.adjacencyList[smallest]:
+
+                # Calculate new distance to the next node
+                candidate = distances[smallest] + neighbor['weight']
+                neighborVal = neighbor['node']
+                if neighborVal in tree.distances:
+                    continue
+                if candidate < distances.get(neighborVal, float("inf")):
+
+                    # Updates the smallest distance to the neighbor
+                    distances[neighborVal] = candidate
+
+                    # Updates the path to the neighbor using smallest
+                    # distance
+                    previous[neighborVal] = smallest
+
+                    # Enqueues the neighbor or lowers its queued priority
+                    nodes.enqueue(neighborVal, candidate)
+        return tree
+
+    def bidirectionalDijkstra(self, start, finish):
+        '''
+            Performs Dijkstra's shortest path algorithm from both ends at
+            once, alternating a forward search from start and a backward
+            search from finish, and stops as soon as the two frontiers
+            can no longer improve the best meeting point found
+
+            Parameters:
+                start [string]: the starting vertex
+                finish [string]: the destination vertex
+
+            Returns:
+                A tuple of the shortest path (same format as Dijkstra)
+                and the number of vertices settled by both searches
+        '''
+        if start not in self.adjacencyList or finish not in self.adjacencyList:
+            return [], 0
+        if start == finish:
+            return [start], 1
+
+        # Index 0 is the forward search and index 1 the backward search
+        queues = [DijkstraPriorityQueue([]), DijkstraPriorityQueue([])]
+        distances = [{start: 0}, {finish: 0}]
+        previous = [{start: None}, {finish: None}]
+        settled = [set(), set()]
+        queues[0].enqueue(start, 0)
+        queues[1].enqueue(finish, 0)
+        best = float("inf")
+        meeting = None
+
+        while len(queues[0].values) and len(queues[1].values):
+
+            # The best path is final once no pair of frontier vertices
+            # can produce a shorter one
+            if queues[0].values[0].priority + \
+                    queues[1].values[0].priority >= best:
+                break
+
+            # Expands the side with the smaller frontier
+            side = 0 if len(queues[0].values) <= len(queues[1].values) else 1
+            other = 1 - side
+            node = queues[side].dequeue()
+            current = node.val
+            if current in settled[side] or \
+                    node.priority > distances[side][current]:
+                continue
+            settled[side].add(current)
+
+            for neighbor in self.adjacencyList[current]:
+                candidate = distances[side][current] + neighbor['weight']
+                neighborVal = neighbor['node']
+                if candidate < distances[side].get(neighborVal, float("inf")):
+                    distances[side][neighborVal] = candidate
+                    previous[side][neighborVal] = current
+                    queues[side].enqueue(neighborVal, candidate)
+                if neighborVal in distances[other]:
+                    total = distances[side][neighborVal] + \
+                        distances[other][neighborVal]
+                    if total < best:
+                        best = total
+                        meeting = neighborVal
+
+        count = len(settled[0]) + len(settled[1])
+        if meeting is None:
+            return [], count
+
+        # Builds the forward half in reverse order and then appends the
+        # backward half which is already in order towards finish
+        path = []
+        current = meeting
+        while current is not None:
+            path.append(current)
+            current = previous[0][current]
+        path.reverse()
+        current = previous[1][meeting]
+        while current is not None:
+            path.append(current)
+            current = previous[1][current]
+        return path, count
+
+    def aStar(self, start, finish, heuristic):
+        '''
+            Performs A* search which is Dijkstra's algorithm with each
+            vertex prioritized by its distance from start plus an
+            estimate of its remaining distance to finish
+
+            The heuristic must never overestimate the remaining distance
+            (eg. haversine distance between vertex coordinates on a road
+            network with lengths as weights) or the path may not be the
+            shortest. A heuristic that always returns 0 gives Dijkstra.
+
+            Parameters:
+                start [string]: the starting vertex
+                finish [string]: the destination vertex
+                heuristic [function]: called as heuristic(vertex, finish)
+                and returns the estimated distance between them
+
+            Returns:
+                A tuple of the shortest path (same format as Dijkstra)
+                and the number of vertices settled
+        '''
+        if start not in self.adjacencyList or finish not in self.adjacencyList:
+            return [], 0
+        nodes = DijkstraPriorityQueue([])
+        distances = {start: 0}
+        previous = {start: None}
+        settled = 0
+        path = []
+        nodes.enqueue(start, heuristic(start, finish))
+
+        while len(nodes.values):
+            node = nodes.dequeue()
+            current = node.val
+
+            # Skips entries left behind by a later improvement
+            if node.priority > distances[current] + heuristic(current, finish):
+                continue
+            settled += 1
+            if current == finish:
+                while current is not None:
+                    path.append(current)
+                    current = previous[current]
                 break
 
-            if smallest:
-                for neighbor in self.adjacencyList[smallest]:
+            for neighbor in self.adjacencyList[current]:
+                candidate = distances[current] + neighbor['weight']
+                neighborVal = neighbor['node']
+                if candidate < distances.get(neighborVal, float("inf")):
+                    distances[neighborVal] = candidate
+                    previous[neighborVal] = current
+                    nodes.enqueue(
+                        neighborVal, candidate + heuristic(neighborVal, finish))
+
+        path.reverse()
+        return path, settled
+
+
+class CompressedGraph:
+    '''
+        Frozen compressed sparse row (CSR) representation of a Graph
+        or WeightedGraph
+
+        Every vertex key is interned to an integer id. The neighbors of
+        vertex id i are stored in targets[offsets[i]:offsets[i + 1]]
+        (with matching entries in weights for a WeightedGraph), so each
+        edge costs a machine word or two instead of a list slot plus a
+        {"node", "weight"} dictionary.
+
+        Measured on a random graph of 20,000 vertices and 100,000 edges:
+            WeightedGraph adjacency list: ~195 bytes per edge entry
+            CompressedGraph (weighted): ~16.8 bytes per edge entry
+            CompressedGraph (unweighted): ~8.8 bytes per edge entry
+
+        The structure cannot be modified after it is built. Rebuild it
+        from the source graph after the graph changes.
+    '''
+
+    def __init__(self, graph):
+        '''
+            Builds the compressed representation from a graph
+            O(V + E)
+
+            Parameters:
+                graph [obj]: the Graph or WeightedGraph to compress
+        '''
+        adjacencyList = graph.adjacencyList
+        self.vertices = list(adjacencyList)
+        self.vertexIds = {}
+        for idx, vertex in enumerate(self.vertices):
+            self.vertexIds[vertex] = idx
+        self.weighted = isinstance(graph, WeightedGraph)
+        self.offsets = array('q', [0])
+        self.targets = array('q')
+        self.weights = array('d') if self.weighted else None
+
+        vertexIds = self.vertexIds
+        for vertex in self.vertices:
+            for neighbor in adjacencyList[vertex]:
+                if self.weighted:
+                    self.targets.append(vertexIds[neighbor['node']])
+                    self.weights.append(neighbor['weight'])
+                else:
+                    self.targets.append(vertexIds[neighbor])
+            self.offsets.append(len(self.targets))
+
+    def __repr__(self):
+        '''
+            Print representation of the compressed graph
+
+            Returns:
+                The string format of the graph size
+        '''
+        return '<CompressedGraph vertices={} edges={}>'.format(
+            len(self.vertices), len(self.targets))
+
+    def neighbors(self, vertex):
+        '''
+            Returns the neighbors of a vertex
+            O(degree)
+
+            Parameters:
+                vertex [string, int]: the vertex key
+
+            Returns:
+                A list of neighboring vertex keys
+        '''
+        idx = self.vertexIds[vertex]
+        return [self.vertices[target] for target in
+                self.targets[self.offsets[idx]:self.offsets[idx + 1]]]
+
+    def memoryUsage(self):
+        '''
+            Reports the memory used by the offsets, targets and weights
+            arrays (vertex keys and the interning map are not counted)
+
+            Returns:
+                A dictionary with the total bytes and bytes per stored
+                edge entry
+        '''
+        total = self.offsets.buffer_info()[1] * self.offsets.itemsize
+        total += self.targets.buffer_info()[1] * self.targets.itemsize
+        if self.weights is not None:
+            total += self.weights.buffer_info()[1] * self.weights.itemsize
+        edges = len(self.targets)
+        return {
+            "bytes": total,
+            "bytesPerEdge": total / edges if edges else 0
+        }
+
+    def breadthFirst(self, start):
+        '''
+            Traverses the graph using breadth first search
+            O(V + E)
+
+            Parameters:
+                start [string, int]: The starting key to use for traversal
+
+            Returns:
+                An array showing the traversal order
+        '''
+        offsets = self.offsets
+        targets = self.targets
+        startId = self.vertexIds[start]
+        visited = bytearray(len(self.vertices))
+        visited[startId] = 1
+        queue = [startId]
+        head = 0
+
+        # Reads the queue with a moving head index instead of pop(0)
+        while head < len(queue):
+            current = queue[head]
+            head += 1
+            for i in range(offsets[current], offsets[current + 1]):
+                neighbor = targets[i]
+                if not visited[neighbor]:
+                    visited[neighbor] = 1
+                    queue.append(neighbor)
+        return [self.vertices[idx] for idx in queue]
+
+    def depthFirstIter(self, start):
+        '''
+            Performs depth first traversal using an iterative
+            algorithm
+            O(V + E)
+
+            Parameters:
+                start [string, int]: the starting key for the traversal
+
+            Returns:
+                An array containing the traversal order
+        '''
+        offsets = self.offsets
+        targets = self.targets
+        startId = self.vertexIds[start]
+        visited = bytearray(len(self.vertices))
+        visited[startId] = 1
+        results = []
+        stack = [startId]
+
+        while len(stack):
+            current = stack.pop()
+            results.append(self.vertices[current])
+            for i in range(offsets[current], offsets[current + 1]):
+                neighbor = targets[i]
+                if not visited[neighbor]:
+                    visited[neighbor] = 1
+                    stack.append(neighbor)
+        return results
 
-                    # Calculate new distance to the next node
-                    candidate = distances[smallest] + neighbor['weight']
-                    neighborVal = neighbor['node']
-                    if candidate < distances[neighborVal]:
+    def multiSourceBFS(self, sources, batchSize=256, processes=None):
+        '''
+            Computes breadth first search distances from many sources
+            The sources are run in batches of bitsets, level by level,
+            and the batches can be spread across a process pool that
+            receives the read-only graph arrays once per worker
+
+            The pool needs the stdlib queue module, so with processes set
+            import this module as Data_Structures.graph (from the
+            repository root) and not from inside Data_Structures, where
+            queue.py shadows it
+
+            Parameters:
+                sources [list]: the starting vertex keys
+                batchSize [int]: the number of sources per bitset batch
+                processes [int]: the number of worker processes (None
+                runs every batch in this process)
 
-                        # Updates the smallest distance to the neighbor
-                        distances[neighborVal] = candidate
+            Returns:
+                A dictionary of source key -> distance array indexed by
+                vertex id (see vertices) with -1 for unreachable vertices
+        '''
+        ids = [self.vertexIds[source] for source in sources]
+        batches = [ids[i:i + batchSize] for i in range(0, len(ids), batchSize)]
+        if processes is None:
+            results = [bfsBatch(batch, self.offsets, self.targets)
+                       for batch in batches]
+        else:
+            from concurrent.futures import ProcessPoolExecutor
+            with ProcessPoolExecutor(
+                    max_workers=processes, initializer=initBfsWorker,
+                    initargs=(self.offsets, self.targets)) as executor:
+                results = list(executor.map(bfsBatch, batches))
 
-                        # Updates the path to the neighbor using smallest
-                        # distance
-                        previous[neighborVal] = smallest
+        distances = {}
+        for batch, result in zip(batches, results):
+            for source, distance in zip(batch, result):
+                distances[self.vertices[source]] = distance
+        return distances
 
-                        # Enqueue priority queue with new priority
-                        nodes.enqueue(neighborVal, candidate)
+    def Dijkstra(self, start, finish):
+        '''
+            Performs Dijkstra's shortest path algorithm to find the
+            shortest path between the start and finish nodes
+            Edges of an unweighted graph count as weight 1
+
+            Parameters:
+                start [string, int]: the starting vertex
+                finish [string, int]: the destination vertex
+
+            Returns:
+                The list of vertices on the shortest path (empty if
+                there is no path)
+        '''
+        if start not in self.vertexIds or finish not in self.vertexIds:
+            return []
+        offsets = self.offsets
+        targets = self.targets
+        weights = self.weights
+        startId = self.vertexIds[start]
+        finishId = self.vertexIds[finish]
+        distances = [float("inf")] * len(self.vertices)
+        previous = [-1] * len(self.vertices)
+        distances[startId] = 0
+        nodes = IndexedPriorityQueue()
+        nodes.enqueue(startId, 0)
+        path = []
+
+        while len(nodes.values):
+            smallest = nodes.dequeue().val
+            if smallest == finishId:
+                while smallest != -1:
+                    path.append(self.vertices[smallest])
+                    smallest = previous[smallest]
+                break
+
+            for i in range(offsets[smallest], offsets[smallest + 1]):
+                neighbor = targets[i]
+                weight = weights[i] if weights is not None else 1
+                candidate = distances[smallest] + weight
+                if candidate < distances[neighbor]:
+                    distances[neighbor] = candidate
+                    previous[neighbor] = smallest
+                    nodes.enqueue(neighbor, candidate)
 
-        # Reverse the path so that it starts at the beginning
         path.reverse()
         return path
+
+
+def jsonKeySupported(key):
+    '''
+        Checks that a vertex key comes back unchanged from a JSON round
+        trip through ContractionHierarchy.save() and load()
+
+        Parameters:
+            key [any]: the vertex key
+
+        Returns:
+            True if the key is a string, number, boolean, None or a
+            tuple of those
+    '''
+    if isinstance(key, tuple):
+        return all(jsonKeySupported(item) for item in key)
+    return key is None or isinstance(key, (str, int, float))
+
+
+def jsonKeyFromList(key):
+    '''
+        Turns the lists JSON stores tuple keys as back into tuples
+
+        Parameters:
+            key [any]: the vertex key read from JSON
+
+        Returns:
+            The vertex key with every list turned into a tuple
+    '''
+    if isinstance(key, list):
+        return tuple(jsonKeyFromList(item) for item in key)
+    return key
+
+
+class ContractionHierarchy:
+    '''
+        Contraction hierarchy (CH) built offline from a WeightedGraph
+        for fast point-to-point shortest path queries
+
+        Preprocessing contracts the vertices one at a time in order of
+        importance. When a vertex is removed, a shortcut edge is added
+        between any two of its neighbors whose shortest path ran
+        through it. Each vertex keeps only its edges to more important
+        vertices (the upward graph), so a query is a bidirectional
+        Dijkstra search that only ever climbs and settles a small
+        fraction of the graph.
+
+        Queries return the same distances as WeightedGraph.Dijkstra
+        (for float weights the distance may differ in the last bits
+        since sums are added in another order). When several shortest
+        paths tie, the path returned may differ from Dijkstra's but has
+        the same cost. Rebuild the hierarchy after the graph changes.
+    '''
+
+    def __init__(self, graph=None, witnessLimit=50):
+        '''
+            Builds the hierarchy from a weighted graph
+
+            Parameters:
+                graph [obj]: the WeightedGraph to preprocess (None
+                creates an empty hierarchy, used by load())
+                witnessLimit [int]: the most vertices a witness search
+                may settle before giving up and adding the shortcut;
+                lower is faster to build but adds more shortcuts
+        '''
+        self.vertices = []
+        self.vertexIds = {}
+        self.rank = []
+        self.upward = []
+        self.middles = {}
+        self.shortcuts = 0
+        if graph is not None:
+            self.build(graph, witnessLimit)
+
+    def __repr__(self):
+        '''
+            Print representation of the contraction hierarchy
+
+            Returns:
+                The string format of the hierarchy size
+        '''
+        return '<ContractionHierarchy vertices={} edges={} shortcuts={}>'.format(
+            len(self.vertices), self.edgeCount(), self.shortcuts)
+
+    def edgeCount(self):
+        '''
+            Returns the number of upward edges, shortcuts included
+
+            Returns:
+                The size of the query index in edges
+        '''
+        return sum(len(edges) for edges in self.upward)
+
+    def build(self, graph, witnessLimit):
+        '''
+            Contracts every vertex of the graph and records the upward
+            edges of each one
+
+            Parameters:
+                graph [obj]: the WeightedGraph to preprocess
+                witnessLimit [int]: the witness search settle limit
+        '''
+        self.vertices = list(graph.adjacencyList)
+        for idx, vertex in enumerate(self.vertices):
+            self.vertexIds[vertex] = idx
+        count = len(self.vertices)
+
+        # Remaining graph: for each vertex id a map of
+        # neighbor id -> [weight, middle vertex id or -1]
+        # Parallel edges keep the lightest one and self loops are dropped
+        remaining = [{} for _ in range(count)]
+        for vertex in self.vertices:
+            idx = self.vertexIds[vertex]
+            for neighbor in graph.adjacencyList[vertex]:
+                neighborId = self.vertexIds[neighbor['node']]
+                if neighborId == idx:
+                    continue
+                edge = remaining[idx].get(neighborId)
+                if edge is None or neighbor['weight'] < edge[0]:
+                    remaining[idx][neighborId] = [neighbor['weight'], -1]
+
+        self.rank = [0] * count
+        self.upward = [[] for _ in range(count)]
+        contractedNeighbors = [0] * count
+        order = IndexedPriorityQueue()
+        for idx in range(count):
+            order.enqueue(idx, self.importance(
+                remaining, idx, contractedNeighbors, witnessLimit))
+
+        nextRank = 0
+        while len(order.values):
+            node = order.dequeue()
+            idx = node.val
+
+            # Lazy update: the importance may have grown since it was
+            # queued, so it is only contracted if it is still the minimum
+            priority = self.importance(
+                remaining, idx, contractedNeighbors, witnessLimit)
+            if len(order.values) and priority > order.values[0].priority:
+                order.enqueue(idx, priority)
+                continue
+
+            self.rank[idx] = nextRank
+            nextRank += 1
+            for neighborId, edge in remaining[idx].items():
+                self.upward[idx].append((neighborId, edge[0]))
+                self.middles[(idx, neighborId)] = edge[1]
+
+            for source, target, weight in self.neededShortcuts(
+                    remaining, idx, witnessLimit):
+                edge = remaining[source].get(target)
+                if edge is None or weight < edge[0]:
+                    remaining[source][target] = [weight, idx]
+                    remaining[target][source] = [weight, idx]
+                    if edge is None:
+                        self.shortcuts += 1
+
+            for neighborId in remaining[idx]:
+                del remaining[neighborId][idx]
+                contractedNeighbors[neighborId] += 1
+            remaining[idx] = {}
+
+    def importance(self, remaining, idx, contractedNeighbors, witnessLimit):
+        '''
+            Estimates how expensive it is to contract a vertex using the
+            edge difference (shortcuts added less edges removed) plus
+            the number of neighbors already contracted, which spreads
+            contractions evenly across the graph
+
+            Returns:
+                The contraction priority of the vertex (lower first)
+        '''
+        shortcuts = len(self.neededShortcuts(remaining, idx, witnessLimit))
+        return 2 * shortcuts - len(remaining[idx]) + contractedNeighbors[idx]
+
+    def neededShortcuts(self, remaining, idx, witnessLimit):
+        '''
+            Finds the shortcuts required to contract a vertex: for each
+            pair of its neighbors u, w a shortcut is needed unless a
+            witness path from u to w that avoids the vertex is no longer
+            than the path through it
+
+            Returns:
+                A list of (source id, target id, weight) tuples with each
+                pair listed once
+        '''
+        neighbors = list(remaining[idx].items())
+        shortcuts = []
+        for i, (source, sourceEdge) in enumerate(neighbors):
+            if i == len(neighbors) - 1:
+                break
+            targets = neighbors[i + 1:]
+            limit = sourceEdge[0] + max(edge[0] for _, edge in targets)
+            witness = self.witnessSearch(
+                remaining, source, idx, limit, witnessLimit)
+            for target, targetEdge in targets:
+                via = sourceEdge[0] + targetEdge[0]
+                if witness.get(target, float("inf")) > via:
+                    shortcuts.append((source, target, via))
+        return shortcuts
+
+    def witnessSearch(self, remaining, source, ignore, limit, witnessLimit):
+        '''
+            Bounded Dijkstra search from source in the remaining graph
+            that never passes through the vertex being contracted
+
+            Returns:
+                A dictionary of vertex id -> distance found
+        '''
+        nodes = IndexedPriorityQueue()
+        distances = {source: 0}
+        settled = 0
+        nodes.enqueue(source, 0)
+        while len(nodes.values) and settled < witnessLimit:
+            node = nodes.dequeue()
+            if node.priority > limit:
+                break
+            settled += 1
+            for neighborId, edge in remaining[node.val].items():
+                if neighborId == ignore:
+                    continue
+                candidate = node.priority + edge[0]
+                if candidate < distances.get(neighborId, float("inf")):
+                    distances[neighborId] = candidate
+                    nodes.enqueue(neighborId, candidate)
+        return distances
+
+    def search(self, start, finish):
+        '''
+            Runs the upward bidirectional search between two vertex ids
+
+            Returns:
+                A tuple of the distance, the meeting vertex id (None when
+                unreachable) and the previous-vertex maps of both sides
+        '''
+        upward = self.upward
+        queues = [IndexedPriorityQueue(), IndexedPriorityQueue()]
+        distances = [{start: 0}, {finish: 0}]
+        previous = [{start: None}, {finish: None}]
+        queues[0].enqueue(start, 0)
+        queues[1].enqueue(finish, 0)
+        best = float("inf")
+        meeting = None
+        if start == finish:
+            best = 0
+            meeting = start
+
+        active = [True, True]
+        while active[0] or active[1]:
+            for side in (0, 1):
+                queue = queues[side]
+                if not active[side]:
+                    continue
+
+                # A side whose next vertex is already farther than the
+                # best meeting point has nothing left to contribute
+                if not len(queue.values) or queue.values[0].priority >= best:
+                    active[side] = False
+                    continue
+                current = queue.dequeue().val
+                distance = distances[side][current]
+                otherDistance = distances[1 - side].get(current)
+                if otherDistance is not None and \
+                        distance + otherDistance < best:
+                    best = distance + otherDistance
+                    meeting = current
+                for neighborId, weight in upward[current]:
+                    candidate = distance + weight
+                    if candidate < distances[side].get(
+                            neighborId, float("inf")):
+                        distances[side][neighborId] = candidate
+                        previous[side][neighborId] = current
+                        queue.enqueue(neighborId, candidate)
+        return best, meeting, previous
+
+    def unpack(self, source, target):
+        '''
+            Expands an edge of the hierarchy, replacing shortcuts by the
+            original edges they stand for
+
+            Parameters:
+                source [int]: the vertex id at one end of the edge
+                target [int]: the vertex id at the other end
+
+            Returns:
+                The list of vertex ids from source to target
+        '''
+        path = [source]
+        stack = [(source, target)]
+        while len(stack):
+            current, following = stack.pop()
+            if self.rank[current] < self.rank[following]:
+                middle = self.middles[(current, following)]
+            else:
+                middle = self.middles[(following, current)]
+            if middle == -1:
+                path.append(following)
+            else:
+                stack.append((middle, following))
+                stack.append((current, middle))
+        return path
+
+    def distance(self, start, finish):
+        '''
+            Returns the shortest distance between two vertices
+
+            Parameters:
+                start [string]: the starting vertex
+                finish [string]: the destination vertex
+
+            Returns:
+                The distance, or infinity when there is no path
+        '''
+        if start not in self.vertexIds or finish not in self.vertexIds:
+            return float("inf")
+        return self.search(
+            self.vertexIds[start], self.vertexIds[finish])[0]
+
+    def Dijkstra(self, start, finish):
+        '''
+            Finds the shortest path between the start and finish nodes
+            using the hierarchy
+
+            Parameters:
+                start [string]: the starting vertex
+                finish [string]: the destination vertex
+
+            Returns:
+                The list of vertices on the shortest path (empty if
+                there is no path)
+        '''
+        if start not in self.vertexIds or finish not in self.vertexIds:
+            return []
+        best, meeting, previous = self.search(
+            self.vertexIds[start], self.vertexIds[finish])
+        if meeting is None:
+            return []
+
+        # Climbs from start to the meeting vertex, then descends to finish
+        chain = []
+        current = meeting
+        while previous[0][current] is not None:
+            chain.append((previous[0][current], current))
+            current = previous[0][current]
+        ids = [current]
+        for source, target in reversed(chain):
+            ids.extend(self.unpack(source, target)[1:])
+        current = meeting
+        while previous[1][current] is not None:
+            ids.extend(self.unpack(current, previous[1][current])[1:])
+            current = previous[1][current]
+        return [self.vertices[idx] for idx in ids]
+
+    def save(self, filename):
+        '''
+            Serializes the hierarchy to a JSON file
+
+            Parameters:
+                filename [string]: the path of the file to write
+
+            * Vertex keys must be strings, numbers, booleans, None or
+            tuples of those (eg. (lat, lon) pairs); JSON stores tuples
+            as lists and load() turns them back into tuples. Any other
+            key type raises ValueError.
+        '''
+        for vertex in self.vertices:
+            if not jsonKeySupported(vertex):
+                raise ValueError(
+                    'vertex {!r} cannot be saved as JSON'.format(vertex))
+        data = {
+            "vertices": self.vertices,
+            "rank": self.rank,
+            "upward": [[[target, weight, self.middles[(idx, target)]]
+                        for target, weight in edges]
+                       for idx, edges in enumerate(self.upward)],
+            "shortcuts": self.shortcuts
+        }
+        with open(filename, 'w') as file:
+            json.dump(data, file)
+
+    @classmethod
+    def load(cls, filename):
+        '''
+            Loads a hierarchy written by save()
+
+            Parameters:
+                filename [string]: the path of the file to read
+
+            Returns:
+                The ContractionHierarchy instance
+        '''
+        with open(filename) as file:
+            data = json.load(file)
+        hierarchy = cls()
+        hierarchy.vertices = [jsonKeyFromList(vertex)
+                              for vertex in data["vertices"]]
+        for idx, vertex in enumerate(hierarchy.vertices):
+            hierarchy.vertexIds[vertex] = idx
+        hierarchy.rank = data["rank"]
+        hierarchy.shortcuts = data["shortcuts"]
+        for idx, edges in enumerate(data["upward"]):
+            hierarchy.upward.append([])
+            for target, weight, middle in edges:
+                hierarchy.upward[idx].append((target, weight))
+                hierarchy.middles[(idx, target)] = middle
+        return hierarchy
+
+
+# Multi-source breadth first search helpers
+# These live at module level so a process pool can pickle them
+sharedGraph = {}
+
+
+def initBfsWorker(offsets, targets):
+    '''
+        Stores the compressed graph arrays once per worker process so
+        batches can be sent without copying the graph each time
+
+        Parameters:
+            offsets [array]: the CSR offsets array
+            targets [array]: the CSR targets array
+    '''
+    sharedGraph["offsets"] = offsets
+    sharedGraph["targets"] = targets
+
+
+def bfsBatch(sources, offsets=None, targets=None):
+    '''
+        Runs breadth first search from a batch of sources at once
+        Each vertex holds an integer bitset with one bit per source, so
+        a single sweep over the edges of a level advances every source
+
+        Parameters:
+            sources [list]: the vertex ids to search from
+            offsets [array]: the CSR offsets array (defaults to the one
+            stored by initBfsWorker)
+            targets [array]: the CSR targets array
+
+        Returns:
+            A list of distance arrays, one per source, indexed by vertex
+            id with -1 for unreachable vertices
+    '''
+    if offsets is None:
+        offsets = sharedGraph["offsets"]
+        targets = sharedGraph["targets"]
+    count = len(offsets) - 1
+    seen = [0] * count
+    frontier = {}
+    distances = []
+    for bit, source in enumerate(sources):
+        distances.append(array('q', [-1]) * count)
+        distances[bit][source] = 0
+        seen[source] |= 1 << bit
+        frontier[source] = frontier.get(source, 0) | 1 << bit
+
+    level = 0
+    while frontier:
+        level += 1
+        following = {}
+        for vertex, bits in frontier.items():
+            for i in range(offsets[vertex], offsets[vertex + 1]):
+                neighbor = targets[i]
+                new = bits & ~seen[neighbor]
+                if new:
+                    following[neighbor] = following.get(neighbor, 0) | new
+
+        # Records the level for every source bit that reached a vertex
+        for vertex, bits in following.items():
+            seen[vertex] |= bits
+            while bits:
+                lowest = bits & -bits
+                distances[lowest.bit_length() - 1][vertex] = level
+                bits ^= lowest
+        frontier = following
+    return distances
+
+
+# Benchmarks
+# Each builds its own input from a seed and returns its measurements
+# in a dictionary, eg. from the repository root:
+#   python -c "from Data_Structures.graph import *;
+#              print(benchmarkContractionHierarchy())"
+def gridGraph(rows, cols, seed=0):
+    '''
+        Builds a grid shaped weighted graph, similar to a road network
+
+        Parameters:
+            rows [int]: the number of rows
+            cols [int]: the number of columns
+            seed [int]: seeds the random edge weights
+
+        Returns:
+            A WeightedGraph with a (row, col) vertex per cell and an
+            edge of random weight 1 to 100 to each right and lower
+            neighbor
+    '''
+    generator = random.Random(seed)
+    graph = WeightedGraph()
+    for row in range(rows):
+        for col in range(cols):
+            graph.addVertex((row, col))
+    for row in range(rows):
+        for col in range(cols):
+            if col + 1 < cols:
+                graph.addEdge((row, col), (row, col + 1),
+                              generator.randint(1, 100))
+            if row + 1 < rows:
+                graph.addEdge((row, col), (row + 1, col),
+                              generator.randint(1, 100))
+    return graph
+
+
+def benchmarkContractionHierarchy(rows=30, cols=30, queries=200, seed=0):
+    '''
+        Measures the preprocessing time, index size and query speedup of
+        a ContractionHierarchy over WeightedGraph.Dijkstra on a grid
+
+        Parameters:
+            rows [int]: the number of grid rows
+            cols [int]: the number of grid columns
+            queries [int]: the number of random start/finish pairs
+            seed [int]: seeds the edge weights and the queries
+
+        Returns:
+            A dictionary with the vertex count, preprocessing seconds,
+            shortcut count, saved index bytes, microseconds per query
+            for Dijkstra and the hierarchy, the speedup, and the number
+            of queries whose path cost differed (should be 0)
+    '''
+    graph = gridGraph(rows, cols, seed)
+    vertices = list(graph.adjacencyList)
+    generator = random.Random(seed + 1)
+    pairs = [(generator.choice(vertices), generator.choice(vertices))
+             for _ in range(queries)]
+
+    started = time.perf_counter()
+    hierarchy = ContractionHierarchy(graph)
+    preprocessing = time.perf_counter() - started
+    with tempfile.TemporaryDirectory() as directory:
+        filename = os.path.join(directory, 'hierarchy.json')
+        hierarchy.save(filename)
+        indexBytes = os.path.getsize(filename)
+
+    def pathCost(path):
+        '''
+            Adds up the weights along a path
+        '''
+        return sum(min(edge["weight"] for edge in graph.adjacencyList[vertex]
+                       if edge["node"] == following)
+                   for vertex, following in zip(path, path[1:]))
+
+    started = time.perf_counter()
+    expected = [graph.Dijkstra(start, finish) for start, finish in pairs]
+    dijkstraTime = time.perf_counter() - started
+    started = time.perf_counter()
+    found = [hierarchy.Dijkstra(start, finish) for start, finish in pairs]
+    hierarchyTime = time.perf_counter() - started
+
+    return {
+        "vertices": len(vertices),
+        "preprocessingSeconds": preprocessing,
+        "shortcuts": hierarchy.shortcuts,
+        "indexBytes": indexBytes,
+        "dijkstraMicroseconds": dijkstraTime / queries * 1e6,
+        "hierarchyMicroseconds": hierarchyTime / queries * 1e6,
+        "speedup": dijkstraTime / hierarchyTime,
+        "costMismatches": sum(pathCost(a) != pathCost(b)
+                              for a, b in zip(expected, found))
+    }
+
+
+def benchmarkEdgeChurn(vertices=300, edges=20000, rounds=20000,
+                       hubDegree=5000, seed=0):
+    '''
+        Compares Graph and HashedGraph under edge churn and hub removal
+
+        Parameters:
+            vertices [int]: the number of vertices in the churn graph
+            edges [int]: the number of distinct random edges it starts
+            with
+            rounds [int]: the number of remove, hasEdge and add rounds
+            hubDegree [int]: the degree of the vertex removed at the end
+            seed [int]: seeds the random edges
+
+        Returns:
+            A dictionary mapping each class name to its churn seconds
+            and hub removal seconds
+    '''
+    generator = random.Random(seed)
+    edgeSet = set()
+    while len(edgeSet) < edges:
+        vertex1 = generator.randrange(vertices)
+        vertex2 = generator.randrange(vertices)
+        if vertex1 != vertex2:
+            edgeSet.add((min(vertex1, vertex2), max(vertex1, vertex2)))
+    edgeList = sorted(edgeSet)
+    churn = [generator.choice(edgeList) for _ in range(rounds)]
+
+    results = {}
+    for graphClass in (Graph, HashedGraph):
+        graph = graphClass()
+        for vertex in range(vertices):
+            graph.addVertex(vertex)
+        for vertex1, vertex2 in edgeList:
+            graph.addEdge(vertex1, vertex2)
+        started = time.perf_counter()
+        for vertex1, vertex2 in churn:
+            graph.removeEdge(vertex1, vertex2)
+            graph.hasEdge(vertex1, vertex2)
+            graph.addEdge(vertex1, vertex2)
+        churnTime = time.perf_counter() - started
+
+        graph = graphClass()
+        graph.addVertex("hub")
+        for vertex in range(hubDegree):
+            graph.addVertex(vertex)
+            graph.addEdge("hub", vertex)
+        started = time.perf_counter()
+        graph.removeVertex("hub")
+        results[graphClass.__name__] = {
+            "churnSeconds": churnTime,
+            "hubRemovalSeconds": time.perf_counter() - started
+        }
+    return results
@@ -4,6 +4,13 @@
 '''
 
 
+from array import array
+from itertools import permutations
+import random
+import time
+import zlib
+
+
 def hash(key, arrayLen):
     '''
         Hashes a key with respect to an array length
@@ -13,3 +20,992 @@ def hash(key, arrayLen):
         value = ord(char) - 96
         total = (total + value) % arrayLen
     return total
+
+
+# Seeded string hashes
+# Each takes (key, arrayLen) like hash() so it can be passed to
+# HashTable, plus an optional seed. Unlike hash() they depend on the
+# order of the characters, so anagrams do not collide. Keys must be
+# strings or bytes: hashing other types through str() would send keys
+# that are equal (1, 1.0 and True) to different slots.
+FNV_OFFSET = 0xcbf29ce484222325
+FNV_PRIME = 0x100000001b3
+MERSENNE_61 = (1 << 61) - 1
+POLYNOMIAL_BASE = 1000003
+MASK_64 = (1 << 64) - 1
+PRIME64_1 = 0x9E3779B185EBCA87
+PRIME64_2 = 0xC2B2AE3D27D4EB4F
+PRIME64_3 = 0x165667B19E3779F9
+PRIME64_4 = 0x85EBCA77C2B2AE63
+PRIME64_5 = 0x27D4EB2F165667C5
+
+
+def toBytes(key):
+    '''
+        Converts a key to bytes for hashing
+
+        Parameters:
+            key [string, bytes]: the key (bytes, bytearray and
+            memoryview keys are used as they are)
+
+        Returns:
+            The UTF-8 bytes of the key
+
+        * Raises TypeError for any other type of key
+    '''
+    if isinstance(key, (bytes, bytearray, memoryview)):
+        return key
+    if not isinstance(key, str):
+        raise TypeError('hash keys must be str or bytes, not {}'.format(
+            type(key).__name__))
+    return key.encode('utf-8')
+
+
+def polynomialHash(key, arrayLen, seed=0):
+    '''
+        Polynomial rolling hash of the key bytes modulo the Mersenne
+        prime 2^61 - 1
+
+        Parameters:
+            key [string]: the key to hash
+            arrayLen [int]: the number of slots
+            seed [int]: changes the hash of every key
+
+        Returns:
+            The slot index of the key
+    '''
+    total = seed % MERSENNE_61
+    for byte in toBytes(key):
+        total = (total * POLYNOMIAL_BASE + byte + 1) % MERSENNE_61
+    return total % arrayLen
+
+
+def fnv1aHash(key, arrayLen, seed=0):
+    '''
+        64-bit FNV-1a hash of the key bytes
+
+        Parameters:
+            key [string]: the key to hash
+            arrayLen [int]: the number of slots
+            seed [int]: mixed into the offset basis
+
+        Returns:
+            The slot index of the key
+    '''
+    total = (FNV_OFFSET ^ seed) & MASK_64
+    for byte in toBytes(key):
+        total = ((total ^ byte) * FNV_PRIME) & MASK_64
+    return total % arrayLen
+
+
+def rotateLeft(value, bits):
+    '''
+        Rotates a 64-bit value left
+    '''
+    return ((value << bits) | (value >> (64 - bits))) & MASK_64
+
+
+def mixHash(key, arrayLen, seed=0):
+    '''
+        Multiply-rotate hash modeled on the short-input path of xxHash64
+        It reads the key 8 bytes at a time and ends with an avalanche
+        step so that every input bit affects every output bit
+
+        Parameters:
+            key [string]: the key to hash
+            arrayLen [int]: the number of slots
+            seed [int]: changes the hash of every key
+
+        Returns:
+            The slot index of the key
+    '''
+    data = toBytes(key)
+    length = len(data)
+    total = (seed + PRIME64_5 + length) & MASK_64
+    i = 0
+    while i + 8 <= length:
+        lane = int.from_bytes(data[i:i + 8], 'little')
+        lane = (rotateLeft((lane * PRIME64_2) & MASK_64, 31) * PRIME64_1) & MASK_64
+        total = (rotateLeft(total ^ lane, 27) * PRIME64_1 + PRIME64_4) & MASK_64
+        i += 8
+    while i < length:
+        total ^= (data[i] * PRIME64_5) & MASK_64
+        total = (rotateLeft(total, 11) * PRIME64_1) & MASK_64
+        i += 1
+    total ^= total >> 33
+    total = (total * PRIME64_2) & MASK_64
+    total ^= total >> 29
+    total = (total * PRIME64_3) & MASK_64
+    total ^= total >> 32
+    return total % arrayLen
+
+
+def crc32Hash(key, arrayLen, seed=0):
+    '''
+        CRC-32 of the key bytes computed in C by zlib, the fastest of
+        these hashes from Python
+
+        Parameters:
+            key [string]: the key to hash
+            arrayLen [int]: the number of slots
+            seed [int]: the starting CRC value
+
+        Returns:
+            The slot index of the key
+    '''
+    return zlib.crc32(toBytes(key), seed) % arrayLen
+
+
+def hashBatch(keys, arrayLen, seed=0, hashFunction=None):
+    '''
+        Hashes a whole column of keys at once, a standard library
+        stand in for a NumPy batch mode: it still hashes one key at a
+        time in a list comprehension, but skips the extra call through
+        crc32Hash for each key
+
+        Parameters:
+            keys [iterable]: the string or bytes keys
+            arrayLen [int]: the number of slots
+            seed [int]: changes the hash of every key
+            hashFunction [function]: one of the seeded hashes above
+            (None uses CRC-32, giving the same slots as crc32Hash)
+
+        Returns:
+            An array of slot indexes in the order of keys
+    '''
+    if hashFunction is not None:
+        return array('Q', [hashFunction(key, arrayLen, seed) for key in keys])
+    crc32 = zlib.crc32
+    return array('Q', [crc32(toBytes(key), seed) % arrayLen for key in keys])
+
+
+def hashBuffer(buffer, offsets, arrayLen, seed=0):
+    '''
+        Hashes keys packed end to end in one byte buffer without
+        copying them out, eg. a string column loaded from a file
+
+        Parameters:
+            buffer [bytes]: the concatenated key bytes
+            offsets [sequence]: the n + 1 start offsets of the n keys
+            (the last one is the end of the final key)
+            arrayLen [int]: the number of slots
+            seed [int]: the starting CRC value
+
+        Returns:
+            An array of slot indexes, one per key
+    '''
+    view = memoryview(buffer)
+    crc32 = zlib.crc32
+    return array('Q', [
+        crc32(view[offsets[i]:offsets[i + 1]], seed) % arrayLen
+        for i in range(len(offsets) - 1)])
+
+
+class HashTable:
+    '''
+        Hash table using open addressing with Robin Hood linear probing
+
+        Each key is stored at the first free slot at or after its hashed
+        index. On insert, a key that has probed further than the key in
+        a slot takes that slot and the displaced key keeps probing, which
+        keeps probe lengths short and even. Deletion shifts the
+        following keys back one slot instead of leaving tombstones. The
+        table doubles once it passes its maximum load factor.
+    '''
+
+    def __init__(self, size=53, hashFunction=hash, maxLoad=0.75):
+        '''
+            Initialization of the hash table
+
+            Parameters:
+                size [int]: the initial number of slots
+                hashFunction [function]: called as hashFunction(key,
+                arrayLen) and returns a slot index in [0, arrayLen)
+                maxLoad [float]: the fraction of slots that may be used
+                before the table grows, strictly between 0 and 1 since
+                probing needs a free slot to stop at
+        '''
+        if not 0 < maxLoad < 1:
+            raise ValueError('maxLoad must be between 0 and 1')
+        self.hashFunction = hashFunction
+        self.maxLoad = maxLoad
+        self.size = 0
+        self.allocate(max(size, 1))
+
+    def allocate(self, capacity):
+        '''
+            Replaces the slots with empty ones
+
+            Parameters:
+                capacity [int]: the number of slots
+        '''
+        self.slotKeys = [None] * capacity
+        self.slotValues = [None] * capacity
+
+        # Distance of each key from its hashed index (-1 for empty)
+        self.probeLengths = [-1] * capacity
+
+    def __len__(self):
+        '''
+            Returns the number of keys in the table
+        '''
+        return self.size
+
+    def __contains__(self, key):
+        '''
+            Returns whether a key is in the table
+        '''
+        return self.find(key) is not None
+
+    def __repr__(self):
+        '''
+            Print representation of the hash table
+
+            Returns:
+                The string format of the key/value pairs
+        '''
+        return '{}'.format(dict(zip(self.keys(), self.values())))
+
+    def resize(self, capacity):
+        '''
+            Rehashes every key into a new number of slots
+            O(n)
+
+            Parameters:
+                capacity [int]: the new number of slots
+        '''
+        oldKeys = self.slotKeys
+        oldValues = self.slotValues
+        oldLengths = self.probeLengths
+        self.allocate(capacity)
+        self.size = 0
+        for i in range(len(oldKeys)):
+            if oldLengths[i] != -1:
+                self.set(oldKeys[i], oldValues[i])
+
+    def find(self, key):
+        '''
+            Finds the slot holding a key
+            O(1) expected
+
+            Parameters:
+                key [string]: the key to look up
+
+            Returns:
+                The slot index, or None if the key is not stored
+        '''
+        capacity = len(self.slotKeys)
+        idx = self.hashFunction(key, capacity)
+        distance = 0
+        while True:
+            probeLength = self.probeLengths[idx]
+
+            # A key always sits before any slot whose key probed less
+            # far, so the search can stop there
+            if probeLength < distance:
+                return None
+            if self.slotKeys[idx] == key:
+                return idx
+            idx += 1
+            if idx == capacity:
+                idx = 0
+            distance += 1
+
+    def set(self, key, value):
+        '''
+            Stores a value under a key, replacing any previous value
+            O(1) expected
+
+            Parameters:
+                key [string]: the key
+                value [any]: the value to store
+        '''
+        capacity = len(self.slotKeys)
+        idx = self.hashFunction(key, capacity)
+        distance = 0
+        while True:
+            probeLength = self.probeLengths[idx]
+            if probeLength == distance and self.slotKeys[idx] == key:
+                self.slotValues[idx] = value
+                return
+
+            # Reaching an empty slot or a key that probed less far means
+            # the key is new, so only now can the table need to grow
+            if probeLength < distance:
+                if self.size + 1 > self.maxLoad * capacity:
+                    self.resize(capacity * 2)
+                    self.set(key, value)
+                    return
+                break
+            idx += 1
+            if idx == capacity:
+                idx = 0
+            distance += 1
+
+        while True:
+            probeLength = self.probeLengths[idx]
+            if probeLength == -1:
+                self.slotKeys[idx] = key
+                self.slotValues[idx] = value
+                self.probeLengths[idx] = distance
+                self.size += 1
+                return
+            if probeLength < distance:
+                # Takes the slot from the key that is closer to home and
+                # carries on inserting that one instead
+                key, self.slotKeys[idx] = self.slotKeys[idx], key
+                value, self.slotValues[idx] = self.slotValues[idx], value
+                self.probeLengths[idx] = distance
+                distance = probeLength
+            idx += 1
+            if idx == capacity:
+                idx = 0
+            distance += 1
+
+    def get(self, key):
+        '''
+            Retrieves the value stored under a key
+            O(1) expected
+
+            Parameters:
+                key [string]: the key to look up
+
+            Returns:
+                The value, or None if the key is not stored
+        '''
+        idx = self.find(key)
+        if idx is None:
+            return None
+        return self.slotValues[idx]
+
+    def remove(self, key):
+        '''
+            Removes a key by shifting the keys after it back one slot
+            until one is already at its hashed index or a slot is empty
+            O(1) expected
+
+            Parameters:
+                key [string]: the key to remove
+
+            Returns:
+                The value removed, or None if the key is not stored
+        '''
+        idx = self.find(key)
+        if idx is None:
+            return None
+        value = self.slotValues[idx]
+        capacity = len(self.slotKeys)
+        following = idx + 1 if idx + 1 < capacity else 0
+        while self.probeLengths[following] > 0:
+            self.slotKeys[idx] = self.slotKeys[following]
+            self.slotValues[idx] = self.slotValues[following]
+            self.probeLengths[idx] = self.probeLengths[following] - 1
+            idx = following
+            following = idx + 1 if idx + 1 < capacity else 0
+        self.slotKeys[idx] = None
+        self.slotValues[idx] = None
+        self.probeLengths[idx] = -1
+        self.size -= 1
+        return value
+
+    def keys(self):
+        '''
+            Returns the keys stored in the table
+            O(capacity)
+
+            Returns:
+                A list of keys in slot order
+        '''
+        return [self.slotKeys[i] for i in range(len(self.slotKeys))
+                if self.probeLengths[i] != -1]
+
+    def values(self):
+        '''
+            Returns the values stored in the table
+            O(capacity)
+
+            Returns:
+                A list of values in the same order as keys()
+        '''
+        return [self.slotValues[i] for i in range(len(self.slotValues))
+                if self.probeLengths[i] != -1]
+
+    def probeStats(self):
+        '''
+            Reports how far keys sit from their hashed index, which is
+            the number of extra slots a successful lookup reads
+
+            Returns:
+                A dictionary with the size, capacity, load factor, mean
+                and maximum probe length and a histogram of probe length
+                -> number of keys
+        '''
+        histogram = {}
+        for probeLength in self.probeLengths:
+            if probeLength != -1:
+                histogram[probeLength] = histogram.get(probeLength, 0) + 1
+        total = sum(length * count for length, count in histogram.items())
+        return {
+            "size": self.size,
+            "capacity": len(self.slotKeys),
+            "loadFactor": self.size / len(self.slotKeys),
+            "meanProbeLength": total / self.size if self.size else 0,
+            "maxProbeLength": max(histogram) if histogram else 0,
+            "histogram": histogram
+        }
+
+
+class TreeEntry:
+    '''
+        Node class for the balanced tree of a hash table bucket
+    '''
+
+    __slots__ = ('key', 'value', 'left', 'right', 'height')
+
+    def __init__(self, key, value):
+        '''
+            Initialization of a bucket tree node
+
+            Parameters:
+                key [string]: the key of the entry
+                value [any]: the value of the entry
+        '''
+        self.key = key
+        self.value = value
+        self.left = None
+        self.right = None
+        self.height = 1
+
+    def __repr__(self):
+        '''
+            Print representation of the entry
+
+            Returns:
+                The string format of the key/value pair
+        '''
+        return '{}: {}'.format(self.key, self.value)
+
+
+class BucketTree:
+    '''
+        AVL tree mapping keys to values, used by ChainedHashTable for
+        buckets that have grown long so lookups stay O(logn) even when
+        many keys hash to the same bucket
+
+        Keys in one bucket must be comparable with each other
+    '''
+
+    def __init__(self):
+        '''
+            Initialization of the bucket tree
+        '''
+        self.root = None
+        self.size = 0
+
+    def __len__(self):
+        '''
+            Returns the number of entries in the tree
+        '''
+        return self.size
+
+    def height(self, node):
+        '''
+            Returns the height of a subtree (0 for None)
+        '''
+        return node.height if node is not None else 0
+
+    def rotate(self, node, toLeft):
+        '''
+            Rotates a subtree left or right
+
+            Parameters:
+                node [obj]: the root node of the subtree
+                toLeft [bool]: True to rotate left, False to rotate right
+
+            Returns:
+                The new root node of the subtree
+        '''
+        if toLeft:
+            pivot = node.right
+            node.right = pivot.left
+            pivot.left = node
+        else:
+            pivot = node.left
+            node.left = pivot.right
+            pivot.right = node
+        node.height = 1 + max(self.height(node.left), self.height(node.right))
+        pivot.height = 1 + max(self.height(pivot.left), self.height(pivot.right))
+        return pivot
+
+    def rebalance(self, node):
+        '''
+            Restores the AVL property at a node
+
+            Parameters:
+                node [obj]: the root node of the subtree
+
+            Returns:
+                The new root node of the subtree
+        '''
+        node.height = 1 + max(self.height(node.left), self.height(node.right))
+        balance = self.height(node.left) - self.height(node.right)
+        if balance > 1:
+            if self.height(node.left.left) < self.height(node.left.right):
+                node.left = self.rotate(node.left, True)
+            return self.rotate(node, False)
+        if balance < -1:
+            if self.height(node.right.right) < self.height(node.right.left):
+                node.right = self.rotate(node.right, False)
+            return self.rotate(node, True)
+        return node
+
+    def get(self, key):
+        '''
+            Finds the entry for a key
+            O(logn)
+
+            Parameters:
+                key [string]: the key to look up
+
+            Returns:
+                The entry node, or None if the key is not stored
+        '''
+        current = self.root
+        while current is not None:
+            if key < current.key:
+                current = current.left
+            elif key > current.key:
+                current = current.right
+            else:
+                return current
+        return None
+
+    def set(self, key, value):
+        '''
+            Stores a value under a key
+            O(logn)
+
+            Parameters:
+                key [string]: the key
+                value [any]: the value to store
+
+            Returns:
+                True if the key is new, False if its value was replaced
+        '''
+        added = [False]
+
+        def insert(node):
+            '''
+                Inserts into a subtree and returns its new root
+            '''
+            if node is None:
+                added[0] = True
+                return TreeEntry(key, value)
+            if key < node.key:
+                node.left = insert(node.left)
+            elif key > node.key:
+                node.right = insert(node.right)
+            else:
+                node.value = value
+                return node
+            return self.rebalance(node)
+        self.root = insert(self.root)
+        if added[0]:
+            self.size += 1
+        return added[0]
+
+    def remove(self, key):
+        '''
+            Removes a key
+            O(logn)
+
+            Parameters:
+                key [string]: the key to remove
+
+            Returns:
+                The removed entry, or None if the key is not stored
+        '''
+        removed = [None]
+
+        def delete(node, key):
+            '''
+                Deletes from a subtree and returns its new root
+            '''
+            if node is None:
+                return None
+            if key < node.key:
+                node.left = delete(node.left, key)
+            elif key > node.key:
+                node.right = delete(node.right, key)
+            else:
+                if removed[0] is None:
+                    removed[0] = TreeEntry(node.key, node.value)
+                if node.left is None:
+                    return node.right
+                if node.right is None:
+                    return node.left
+                successor = node.right
+                while successor.left is not None:
+                    successor = successor.left
+                node.key = successor.key
+                node.value = successor.value
+                node.right = delete(node.right, successor.key)
+            return self.rebalance(node)
+        self.root = delete(self.root, key)
+        if removed[0] is not None:
+            self.size -= 1
+        return removed[0]
+
+    def __iter__(self):
+        '''
+            Lazily iterates over the entries in key order
+
+            Yields:
+                Each entry node
+        '''
+        stack = []
+        node = self.root
+        while len(stack) or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node
+            node = node.right
+
+
+class ChainedHashTable:
+    '''
+        Hash table using separate chaining
+
+        Each slot holds a bucket of [key, value] pairs. A bucket that
+        grows past treeifyThreshold entries (eg. under adversarial keys
+        that all hash alike) is converted to a BucketTree so lookups in
+        it stay O(logn), and it turns back into a list once it shrinks.
+        A bucket whose keys cannot all be ordered with < (eg. 1 and '1')
+        stays a list. keys(), values() and items() are lazy.
+    '''
+
+    def __init__(self, size=53, hashFunction=hash, maxLoad=1.0,
+                 treeifyThreshold=8):
+        '''
+            Initialization of the hash table
+
+            Parameters:
+                size [int]: the initial number of buckets
+                hashFunction [function]: called as hashFunction(key,
+                arrayLen) and returns a bucket index in [0, arrayLen)
+                maxLoad [float]: the average bucket length allowed
+                before the table doubles
+                treeifyThreshold [int]: the bucket length at which a
+                list bucket becomes a tree
+        '''
+        self.hashFunction = hashFunction
+        self.maxLoad = maxLoad
+        self.treeifyThreshold = treeifyThreshold
+        self.untreeifyThreshold = max(treeifyThreshold // 2, 1)
+        self.keyMap = [None] * max(size, 1)
+        self.size = 0
+
+    def __len__(self):
+        '''
+            Returns the number of keys in the table
+        '''
+        return self.size
+
+    def __contains__(self, key):
+        '''
+            Returns whether a key is in the table
+        '''
+        return self.entry(key) is not None
+
+    def __repr__(self):
+        '''
+            Print representation of the hash table
+
+            Returns:
+                The string format of the key/value pairs
+        '''
+        return '{}'.format(dict(self.items()))
+
+    def entry(self, key):
+        '''
+            Finds the stored entry for a key
+
+            Parameters:
+                key [string]: the key to look up
+
+            Returns:
+                The [key, value] pair or tree node, or None
+        '''
+        bucket = self.keyMap[self.hashFunction(key, len(self.keyMap))]
+        if bucket is None:
+            return None
+        if isinstance(bucket, BucketTree):
+            try:
+                return bucket.get(key)
+            except TypeError:
+                # A key that cannot be ordered against the tree's keys
+                # is not one of them
+                return None
+        for pair in bucket:
+            if pair[0] == key:
+                return pair
+        return None
+
+    def set(self, key, value):
+        '''
+            Stores a value under a key, replacing any previous value
+            O(1) expected, O(logn) worst case in a tree bucket
+
+            Parameters:
+                key [string]: the key
+                value [any]: the value to store
+        '''
+        idx = self.hashFunction(key, len(self.keyMap))
+        bucket = self.keyMap[idx]
+        if bucket is None:
+            self.keyMap[idx] = [[key, value]]
+        elif isinstance(bucket, BucketTree):
+            try:
+                if not bucket.set(key, value):
+                    return
+            except TypeError:
+                # The key cannot be ordered against the tree's keys (so
+                # it is not one of them), so the bucket goes back to a
+                # list
+                bucket = [[entry.key, entry.value] for entry in bucket]
+                bucket.append([key, value])
+                self.keyMap[idx] = bucket
+        else:
+            for pair in bucket:
+                if pair[0] == key:
+                    pair[1] = value
+                    return
+            bucket.append([key, value])
+            if len(bucket) >= self.treeifyThreshold:
+                tree = self.treeify(bucket)
+                if tree is not None:
+                    self.keyMap[idx] = tree
+        self.size += 1
+        if self.size > self.maxLoad * len(self.keyMap):
+            self.resize(len(self.keyMap) * 2)
+
+    def treeify(self, bucket):
+        '''
+            Builds a tree holding the pairs of a list bucket
+
+            Parameters:
+                bucket [list]: the [key, value] pairs
+
+            Returns:
+                The BucketTree, or None if the keys cannot all be
+                ordered with < (the list bucket is left untouched)
+        '''
+        tree = BucketTree()
+        try:
+            for key, value in bucket:
+                tree.set(key, value)
+        except TypeError:
+            return None
+        return tree
+
+    def get(self, key):
+        '''
+            Retrieves the value stored under a key
+            O(1) expected, O(logn) worst case in a tree bucket
+
+            Parameters:
+                key [string]: the key to look up
+
+            Returns:
+                The value, or None if the key is not stored
+        '''
+        found = self.entry(key)
+        if found is None:
+            return None
+        if isinstance(found, TreeEntry):
+            return found.value
+        return found[1]
+
+    def remove(self, key):
+        '''
+            Removes a key
+            O(1) expected, O(logn) worst case in a tree bucket
+
+            Parameters:
+                key [string]: the key to remove
+
+            Returns:
+                The value removed, or None if the key is not stored
+        '''
+        idx = self.hashFunction(key, len(self.keyMap))
+        bucket = self.keyMap[idx]
+        if bucket is None:
+            return None
+        if isinstance(bucket, BucketTree):
+            try:
+                removed = bucket.remove(key)
+            except TypeError:
+                return None
+            if removed is None:
+                return None
+            if len(bucket) <= self.untreeifyThreshold:
+                self.keyMap[idx] = [[entry.key, entry.value] for entry in bucket]
+            self.size -= 1
+            return removed.value
+        for i in range(len(bucket)):
+            if bucket[i][0] == key:
+                value = bucket.pop(i)[1]
+                if not len(bucket):
+                    self.keyMap[idx] = None
+                self.size -= 1
+                return value
+        return None
+
+    def resize(self, capacity):
+        '''
+            Rehashes every key into a new number of buckets
+            O(n)
+
+            Parameters:
+                capacity [int]: the new number of buckets
+        '''
+        entries = list(self.items())
+        self.keyMap = [None] * capacity
+        self.size = 0
+        for key, value in entries:
+            self.set(key, value)
+
+    def items(self):
+        '''
+            Lazily iterates over the stored pairs
+
+            Yields:
+                Each (key, value) tuple
+        '''
+        for bucket in self.keyMap:
+            if bucket is None:
+                continue
+            if isinstance(bucket, BucketTree):
+                for entry in bucket:
+                    yield entry.key, entry.value
+            else:
+                for key, value in bucket:
+                    yield key, value
+
+    def keys(self):
+        '''
+            Lazily iterates over the stored keys
+
+            Yields:
+                Each key
+        '''
+        for key, _ in self.items():
+            yield key
+
+    def values(self):
+        '''
+            Lazily iterates over the stored values
+
+            Yields:
+                Each value
+        '''
+        for _, value in self.items():
+            yield value
+
+    def bucketStats(self):
+        '''
+            Reports how keys are spread over the buckets
+
+            Returns:
+                A dictionary with the size, number of buckets, load
+                factor, longest bucket and number of tree buckets
+        '''
+        longest = 0
+        trees = 0
+        for bucket in self.keyMap:
+            if bucket is None:
+                continue
+            longest = max(longest, len(bucket))
+            if isinstance(bucket, BucketTree):
+                trees += 1
+        return {
+            "size": self.size,
+            "buckets": len(self.keyMap),
+            "loadFactor": self.size / len(self.keyMap),
+            "longestBucket": longest,
+            "treeBuckets": trees
+        }
+
+
+# Benchmarks
+# Returns its measurements in a dictionary, eg. from the repository
+# root:
+#   python -c "from Data_Structures.hash_table import *;
+#              print(benchmarkHashes())"
+def benchmarkHashes(keyCount=50000, slots=4096, tableKeys=3000, seed=0):
+    '''
+        Compares the distribution quality and speed of hash() and the
+        seeded hashes
+
+        Parameters:
+            keyCount [int]: the number of random keys to hash
+            slots [int]: the number of slots to hash them into
+            tableKeys [int]: the number of keys inserted into a
+            HashTable to measure probe lengths
+            seed [int]: seeds the random keys
+
+        Returns:
+            A dictionary mapping each hash function's name to its keys
+            per second, chi-squared per slot (about 1 for a uniform
+            spread), the number of distinct slots used by 5000 anagrams
+            of 'abcdefg' and the mean probe length of a HashTable using
+            it, plus the keys per second of hashBatch and hashBuffer
+    '''
+    generator = random.Random(seed)
+    letters = 'abcdefghijklmnopqrstuvwxyz0123456789_'
+    keys = [''.join(generator.choice(letters)
+                    for _ in range(generator.randint(5, 16)))
+            for _ in range(keyCount)]
+    anagrams = [''.join(order) for order in permutations('abcdefg')][:5000]
+    expected = keyCount / slots
+
+    results = {}
+    for hashFunction in (hash, polynomialHash, fnv1aHash, mixHash, crc32Hash):
+        started = time.perf_counter()
+        indexes = [hashFunction(key, slots) for key in keys]
+        elapsed = time.perf_counter() - started
+
+        counts = [0] * slots
+        for idx in indexes:
+            counts[idx] += 1
+        chiSquared = sum((count - expected) ** 2 / expected
+                         for count in counts)
+
+        table = HashTable(hashFunction=hashFunction)
+        for key in keys[:tableKeys]:
+            table.set(key, None)
+        results[hashFunction.__name__] = {
+            "keysPerSecond": keyCount / elapsed,
+            "chiSquaredPerSlot": chiSquared / slots,
+            "anagramSlots": len(set(hashFunction(key, slots)
+                                    for key in anagrams)),
+            "meanProbeLength": table.probeStats()["meanProbeLength"]
+        }
+
+    started = time.perf_counter()
+    hashBatch(keys, slots)
+    results["hashBatch"] = {
+        "keysPerSecond": keyCount / (time.perf_counter() - started)}
+
+    encoded = [key.encode('utf-8') for key in keys]
+    offsets = [0]
+    for key in encoded:
+        offsets.append(offsets[-1] + len(key))
+    buffer = b''.join(encoded)
+    started = time.perf_counter()
+    hashBuffer(buffer, offsets, slots)
+    results["hashBuffer"] = {
+        "keysPerSecond": keyCount / (time.perf_counter() - started)}
+    return results
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+'''
+    Node memory benchmark for the linked data structures
+
+    Measures the bytes each structure uses per element with its slotted
+    node classes, and with copies of the same node classes that keep a
+    per-instance __dict__ (the layout before the nodes had __slots__).
+
+    Run from the repository root so the modules import as a package:
+        python -c "from Data_Structures.node_memory import *;
+                   print(benchmarkNodeMemory())"
+'''
+
+
+import random
+import tracemalloc
+
+from Data_Structures import binary_search_tree
+from Data_Structures import doubly_linked_list
+from Data_Structures import graph
+from Data_Structures import priority_queue
+from Data_Structures import queue
+from Data_Structures import singly_linked_list
+from Data_Structures import stack
+
+
+def withoutSlots(nodeClass):
+    '''
+        Copies a slotted node class into a class without __slots__
+
+        Parameters:
+            nodeClass [class]: the node class to copy
+
+        Returns:
+            A class with the same name and methods whose instances store
+            their attributes in a __dict__
+    '''
+    namespace = {}
+    for cls in reversed(nodeClass.__mro__[:-1]):
+        slots = getattr(cls, '__slots__', ())
+        for name, attribute in vars(cls).items():
+            if name not in slots and name not in (
+                    '__slots__', '__dict__', '__weakref__'):
+                namespace[name] = attribute
+    return type(nodeClass.__name__, (), namespace)
+
+
+def bytesPerElement(build, n):
+    '''
+        Measures the memory allocated while building a structure
+
+        Parameters:
+            build [function]: builds the structure and returns it
+            n [int]: the number of values it adds
+
+        Returns:
+            The bytes allocated per value, including the int values
+    '''
+    tracemalloc.start()
+    structure = build()
+    allocated = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del structure
+    return allocated / n
+
+
+def benchmarkNodeMemory(n=100000, seed=0):
+    '''
+        Reports the bytes per element of each linked structure before
+        (nodes with a __dict__) and after (nodes with __slots__)
+
+        Parameters:
+            n [int]: the number of values stored in each structure
+            seed [int]: seeds the insertion order of the trees
+
+        Returns:
+            A dictionary mapping each structure name to a (before,
+            after) pair of bytes per element
+    '''
+    order = list(range(1000, 1000 + n))
+    random.Random(seed).shuffle(order)
+    sequential = range(1000, 1000 + n)
+
+    def enqueueWithPriority(structure, value):
+        '''
+            Enqueues a value using the value as its priority
+        '''
+        structure.enqueue(value, value)
+
+    # name, node classes to swap, constructor, add function, values
+    structures = [
+        ("SinglyLinkedList", [(singly_linked_list, "Node")],
+         singly_linked_list.SinglyLinkedList,
+         singly_linked_list.SinglyLinkedList.push, sequential),
+        ("DoublyLinkedList", [(doubly_linked_list, "Node")],
+         doubly_linked_list.DoublyLinkedList,
+         doubly_linked_list.DoublyLinkedList.push, sequential),
+        ("Stack", [(stack, "Node")], stack.Stack, stack.Stack.push,
+         sequential),
+        ("Queue", [(queue, "Node")], queue.Queue, queue.Queue.enqueue,
+         sequential),
+        ("BinarySearchTree", [(binary_search_tree, "Node")],
+         binary_search_tree.BinarySearchTree,
+         binary_search_tree.BinarySearchTree.insert, order),
+        ("AVLTree", [(binary_search_tree, "Node"),
+                     (binary_search_tree, "AVLNode")],
+         binary_search_tree.AVLTree, binary_search_tree.AVLTree.insert,
+         order),
+        ("PriorityQueue", [(priority_queue, "Node")],
+         lambda: priority_queue.PriorityQueue([]), enqueueWithPriority,
+         order),
+        ("IndexedPriorityQueue", [(graph, "Node")],
+         graph.IndexedPriorityQueue, enqueueWithPriority, order)
+    ]
+
+    results = {}
+    for name, nodeClasses, create, add, values in structures:
+        def build():
+            '''
+                Builds the structure from fresh int objects
+            '''
+            structure = create()
+            for value in values:
+                add(structure, value + 0)
+            return structure
+
+        after = bytesPerElement(build, n)
+        originals = [(module, attribute, getattr(module, attribute))
+                     for module, attribute in nodeClasses]
+        try:
+            for module, attribute, nodeClass in originals:
+                setattr(module, attribute, withoutSlots(nodeClass))
+            before = bytesPerElement(build, n)
+        finally:
+            for module, attribute, nodeClass in originals:
+                setattr(module, attribute, nodeClass)
+        results[name] = (before, after)
+    return results
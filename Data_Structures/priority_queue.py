@@ -9,6 +9,8 @@ class Node:
         Priority queue node class
     '''
 
+    __slots__ = ('value', 'priority')
+
     def __init__(self, value, priority):
         '''
             Initialization of priority queue node
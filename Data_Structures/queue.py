@@ -4,11 +4,18 @@
 '''
 
 
+import asyncio
+import threading
+import time
+
+
 class Node:
     '''
         Node class for the queue data structure
     '''
 
+    __slots__ = ('data', 'next')
+
     def __init__(self, data):
         '''
             Initialization of Node class for queue
@@ -83,6 +90,68 @@ class Queue:
         self.size -= 1
         return temp.data
 
+    def __len__(self):
+        '''
+            Returns the size of the queue
+            O(1)
+        '''
+        return self.size
+
+    def __iter__(self):
+        '''
+            Lazily iterates over the values of the queue
+            O(n) for a full pass
+
+            Yields:
+                Each value from the front of the queue to the back
+        '''
+        current = self.first
+        while current:
+            yield current.data
+            current = current.next
+
+    def extend(self, items):
+        '''
+            Enqueues several values, building their nodes into a chain
+            first and linking it to the end once
+            O(k)
+
+            Parameters:
+                items [iterable]: the values to add in order
+
+            Returns:
+                The size of the queue
+        '''
+        chain = Queue()
+        for data in items:
+            chain.enqueue(data)
+        return self.splice(chain)
+
+    def splice(self, other):
+        '''
+            Moves every node of another queue onto the end of this one
+            by relinking, leaving the other queue empty
+            O(1)
+
+            Parameters:
+                other [obj]: the Queue to append
+
+            Returns:
+                The size of the queue
+        '''
+        if other is self or other.first is None:
+            return self.size
+        if self.first is None:
+            self.first = other.first
+        else:
+            self.last.next = other.first
+        self.last = other.last
+        self.size += other.size
+        other.first = None
+        other.last = None
+        other.size = 0
+        return self.size
+
     def __repr__(self):
         '''
             Print representation of the queue data structure
@@ -96,3 +165,524 @@ class Queue:
             list.append(current.data)
             current = current.next
         return '{}'.format(list)
+
+
+class ArrayQueue:
+    '''
+        Queue data structure class backed by a growable circular buffer
+
+        Values live in one contiguous list and the front of the queue
+        is an index that wraps around, so enqueue and dequeue do not
+        allocate a node per value. The buffer doubles when it is full.
+    '''
+
+    def __init__(self, capacity=16):
+        '''
+            Initialization of the queue data structure
+
+            Parameters:
+                capacity [int]: the initial size of the buffer
+        '''
+        self.values = [None] * max(capacity, 1)
+        self.head = 0
+        self.size = 0
+
+    def grow(self, needed):
+        '''
+            Copies the queue into a buffer large enough to hold needed
+            values, unwrapping it so the front is at index 0
+            O(n)
+
+            Parameters:
+                needed [int]: the number of values the buffer must hold
+        '''
+        capacity = len(self.values)
+        while capacity < needed:
+            capacity *= 2
+        values = [None] * capacity
+        for i in range(self.size):
+            values[i] = self.values[(self.head + i) % len(self.values)]
+        self.values = values
+        self.head = 0
+
+    def enqueue(self, data):
+        '''
+            Adds a value to the end of the queue
+            O(1) amortized
+
+            Parameters:
+                data [integer]: the value added
+
+            Returns:
+                The size of the queue
+        '''
+        values = self.values
+        if self.size == len(values):
+            self.grow(self.size + 1)
+            values = self.values
+
+        # Wraps the index with a comparison, which is cheaper than %
+        idx = self.head + self.size
+        if idx >= len(values):
+            idx -= len(values)
+        values[idx] = data
+        self.size += 1
+        return self.size
+
+    def dequeue(self):
+        '''
+            Removes a value from the beginning of the queue
+            O(1)
+
+            Returns:
+                The value removed
+        '''
+        if self.size == 0:
+            return None
+        head = self.head
+        data = self.values[head]
+        self.values[head] = None
+        head += 1
+        self.head = head if head < len(self.values) else 0
+        self.size -= 1
+        return data
+
+    def extend(self, items):
+        '''
+            Adds several values to the end of the queue, growing the
+            buffer at most once for sized inputs
+            O(k)
+
+            Parameters:
+                items [iterable]: the values to add in order
+
+            Returns:
+                The size of the queue
+        '''
+        if not hasattr(items, '__len__'):
+            items = list(items)
+        if self.size + len(items) > len(self.values):
+            self.grow(self.size + len(items))
+        capacity = len(self.values)
+        idx = (self.head + self.size) % capacity
+        for data in items:
+            self.values[idx] = data
+            idx += 1
+            if idx == capacity:
+                idx = 0
+        self.size += len(items)
+        return self.size
+
+    def drain(self, n):
+        '''
+            Removes up to n values from the beginning of the queue
+            O(k)
+
+            Parameters:
+                n [int]: the most values to remove
+
+            Returns:
+                A list of the values removed, in queue order
+        '''
+        count = min(n, self.size)
+        if count <= 0:
+            return []
+        capacity = len(self.values)
+        end = self.head + count
+        if end <= capacity:
+            drained = self.values[self.head:end]
+            self.values[self.head:end] = [None] * count
+        else:
+            end -= capacity
+            drained = self.values[self.head:] + self.values[:end]
+            self.values[self.head:] = [None] * (capacity - self.head)
+            self.values[:end] = [None] * end
+        self.head = end % capacity
+        self.size -= count
+        return drained
+
+    def __repr__(self):
+        '''
+            Print representation of the queue data structure
+
+            Returns:
+                String representation of the queue
+        '''
+        list = []
+        for i in range(self.size):
+            list.append(self.values[(self.head + i) % len(self.values)])
+        return '{}'.format(list)
+
+
+class BoundedQueue:
+    '''
+        Thread-safe queue with a capacity limit built around Queue
+
+        put() blocks while the queue is full and get() blocks while it
+        is empty, which gives producers backpressure. Both accept a
+        timeout and can be used without blocking.
+    '''
+
+    def __init__(self, capacity):
+        '''
+            Initialization of the bounded queue
+
+            Parameters:
+                capacity [int]: the most values the queue may hold
+        '''
+        self.queue = Queue()
+        self.capacity = capacity
+        self.lock = threading.Lock()
+        self.notEmpty = threading.Condition(self.lock)
+        self.notFull = threading.Condition(self.lock)
+
+    def __len__(self):
+        '''
+            Returns the number of values in the queue
+        '''
+        return self.queue.size
+
+    def __repr__(self):
+        '''
+            Print representation of the bounded queue
+
+            Returns:
+                String representation of the queue
+        '''
+        with self.lock:
+            return repr(self.queue)
+
+    def valueAdded(self):
+        '''
+            Called with the lock held after a value is enqueued
+        '''
+        self.notEmpty.notify()
+
+    def valueRemoved(self):
+        '''
+            Called with the lock held after a value is dequeued
+        '''
+        self.notFull.notify()
+
+    def put(self, data, block=True, timeout=None):
+        '''
+            Adds a value to the end of the queue, waiting for room if
+            the queue is full
+
+            Parameters:
+                data [integer]: the value to add
+                block [bool]: whether to wait when the queue is full
+                timeout [float]: the most seconds to wait (None waits
+                forever)
+
+            Returns:
+                The size of the queue, or False if there was no room
+                before the timeout (or at once when not blocking)
+        '''
+        with self.notFull:
+            if self.queue.size >= self.capacity:
+                if not block or not self.notFull.wait_for(
+                        lambda: self.queue.size < self.capacity, timeout):
+                    return False
+            size = self.queue.enqueue(data)
+            self.valueAdded()
+            return size
+
+    def get(self, block=True, timeout=None):
+        '''
+            Removes a value from the beginning of the queue, waiting for
+            one if the queue is empty
+
+            Parameters:
+                block [bool]: whether to wait when the queue is empty
+                timeout [float]: the most seconds to wait (None waits
+                forever)
+
+            Returns:
+                The value removed, or None if nothing arrived before the
+                timeout (or at once when not blocking)
+        '''
+        with self.notEmpty:
+            if self.queue.size == 0:
+                if not block or not self.notEmpty.wait_for(
+                        lambda: self.queue.size > 0, timeout):
+                    return None
+            data = self.queue.dequeue()
+            self.valueRemoved()
+            return data
+
+
+class AsyncBoundedQueue(BoundedQueue):
+    '''
+        Bounded queue that asyncio tasks can await on
+
+        putAsync() and getAsync() suspend the task instead of the
+        thread. The blocking put() and get() still work from other
+        threads, and each side wakes the other, so producer threads can
+        feed asyncio consumers (and the reverse).
+    '''
+
+    def __init__(self, capacity):
+        '''
+            Initialization of the async bounded queue
+
+            Parameters:
+                capacity [int]: the most values the queue may hold
+        '''
+        BoundedQueue.__init__(self, capacity)
+        self.getters = []
+        self.putters = []
+
+    def wakeOne(self, waiters):
+        '''
+            Resolves the future of the oldest waiting task on its own
+            event loop (called with the lock held)
+
+            Parameters:
+                waiters [list]: the (loop, future) pairs waiting
+        '''
+        while len(waiters):
+            loop, future = waiters.pop(0)
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(self.resolve, future)
+                return
+
+    def resolve(self, future):
+        '''
+            Marks a waiting future as done if it has not timed out
+        '''
+        if not future.done():
+            future.set_result(None)
+
+    def valueAdded(self):
+        '''
+            Wakes a blocked thread and a waiting task after an enqueue
+        '''
+        BoundedQueue.valueAdded(self)
+        self.wakeOne(self.getters)
+
+    def valueRemoved(self):
+        '''
+            Wakes a blocked thread and a waiting task after a dequeue
+        '''
+        BoundedQueue.valueRemoved(self)
+        self.wakeOne(self.putters)
+
+    async def wait(self, waiters, ready, timeout):
+        '''
+            Suspends the task until ready() holds, then runs it with the
+            lock held
+
+            Parameters:
+                waiters [list]: the waiter list to join while waiting
+                ready [function]: returns the result once the queue is
+                ready, or None to keep waiting
+                timeout [float]: the most seconds to wait
+
+            Returns:
+                The result of ready(), or None on timeout
+        '''
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        while True:
+            with self.lock:
+                result = ready()
+                if result is not None:
+                    return result
+                future = loop.create_future()
+                entry = (loop, future)
+                waiters.append(entry)
+            remaining = None if deadline is None else deadline - loop.time()
+            try:
+                await asyncio.wait_for(future, remaining)
+            except (asyncio.TimeoutError, asyncio.CancelledError) as error:
+                with self.lock:
+                    if entry in waiters:
+                        waiters.remove(entry)
+                    else:
+                        # The wakeup was meant for this task, so it is
+                        # passed on to the next waiter
+                        self.wakeOne(waiters)
+                if isinstance(error, asyncio.CancelledError):
+                    raise
+                return None
+
+    async def putAsync(self, data, timeout=None):
+        '''
+            Adds a value to the end of the queue, suspending the task
+            while the queue is full
+
+            Parameters:
+                data [integer]: the value to add
+                timeout [float]: the most seconds to wait (None waits
+                forever)
+
+            Returns:
+                The size of the queue, or False on timeout
+        '''
+        def ready():
+            '''
+                Enqueues the value if there is room
+            '''
+            if self.queue.size >= self.capacity:
+                return None
+            size = self.queue.enqueue(data)
+            self.valueAdded()
+            return size
+        size = await self.wait(self.putters, ready, timeout)
+        return False if size is None else size
+
+    async def getAsync(self, timeout=None):
+        '''
+            Removes a value from the beginning of the queue, suspending
+            the task while the queue is empty
+
+            Parameters:
+                timeout [float]: the most seconds to wait (None waits
+                forever)
+
+            Returns:
+                The value removed, or None on timeout
+        '''
+        def ready():
+            '''
+                Dequeues a value if there is one, wrapped in a list so
+                that a stored None is not mistaken for waiting
+            '''
+            if self.queue.size == 0:
+                return None
+            data = self.queue.dequeue()
+            self.valueRemoved()
+            return [data]
+        result = await self.wait(self.getters, ready, timeout)
+        return None if result is None else result[0]
+
+
+# Benchmarks
+# Returns its measurements in a dictionary, eg. from the repository
+# root (importing this file as plain "queue" would shadow the standard
+# library module that asyncio needs):
+#   python -c "from Data_Structures.queue import *;
+#              print(benchmarkBoundedQueue())"
+def benchmarkBoundedQueue(counts=(1, 2, 4, 8, 16, 32), items=40000,
+                          capacity=64):
+    '''
+        Measures AsyncBoundedQueue throughput under contention, with n
+        producer threads feeding either n consumer threads or n consumer
+        asyncio tasks
+
+        Parameters:
+            counts [tuple]: the numbers of producers and consumers to try
+            items [int]: the number of values passed through per run
+            capacity [int]: the capacity of the queue
+
+        Returns:
+            A dictionary {"threads": {n: items per second},
+            "tasks": {n: items per second}}
+    '''
+    def shares(n):
+        '''
+            Splits the items between n workers
+        '''
+        return [items // n + (1 if i < items % n else 0) for i in range(n)]
+
+    def produce(queue, count):
+        '''
+            Puts count values into the queue
+        '''
+        for i in range(count):
+            queue.put(i)
+
+    def consume(queue, count):
+        '''
+            Gets count values from the queue
+        '''
+        for _ in range(count):
+            queue.get()
+
+    async def consumeAsync(queue, count):
+        '''
+            Gets count values from the queue as a task
+        '''
+        for _ in range(count):
+            await queue.getAsync()
+
+    async def consumeAll(queue, n):
+        '''
+            Runs n consumer tasks until every value is received
+        '''
+        await asyncio.gather(*[consumeAsync(queue, count)
+                               for count in shares(n)])
+
+    results = {"threads": {}, "tasks": {}}
+    for n in counts:
+        queue = AsyncBoundedQueue(capacity)
+        started = time.perf_counter()
+        threads = [threading.Thread(target=produce, args=(queue, count))
+                   for count in shares(n)]
+        threads += [threading.Thread(target=consume, args=(queue, count))
+                    for count in shares(n)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        results["threads"][n] = items / (time.perf_counter() - started)
+
+        queue = AsyncBoundedQueue(capacity)
+        started = time.perf_counter()
+        threads = [threading.Thread(target=produce, args=(queue, count))
+                   for count in shares(n)]
+        for thread in threads:
+            thread.start()
+        asyncio.run(consumeAll(queue, n))
+        for thread in threads:
+            thread.join()
+        results["tasks"][n] = items / (time.perf_counter() - started)
+    return results
+
+
+def benchmarkArrayQueue(n=300000, batch=1000, repeats=3):
+    '''
+        Compares the throughput of the linked Queue and ArrayQueue
+
+        Parameters:
+            n [int]: the number of values added and then removed
+            batch [int]: the drain size for the bulk measurement
+            repeats [int]: the number of runs (the best one is kept)
+
+        Returns:
+            A dictionary with the millions of single operations per
+            second of Queue and ArrayQueue, and the millions of values
+            per second of ArrayQueue.extend followed by drain(batch)
+    '''
+    values = list(range(n))
+
+    def singleOperations(queue):
+        '''
+            Enqueues then dequeues every value one at a time
+        '''
+        started = time.perf_counter()
+        for value in values:
+            queue.enqueue(value)
+        for _ in values:
+            queue.dequeue()
+        return 2 * n / (time.perf_counter() - started) / 1e6
+
+    def bulkOperations():
+        '''
+            Extends with every value then drains them in batches
+        '''
+        queue = ArrayQueue()
+        started = time.perf_counter()
+        queue.extend(values)
+        while len(queue.drain(batch)):
+            pass
+        return 2 * n / (time.perf_counter() - started) / 1e6
+
+    return {
+        "Queue": max(singleOperations(Queue()) for _ in range(repeats)),
+        "ArrayQueue": max(singleOperations(ArrayQueue())
+                          for _ in range(repeats)),
+        "ArrayQueue extend + drain": max(bulkOperations()
+                                         for _ in range(repeats))
+    }
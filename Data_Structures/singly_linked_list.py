@@ -4,11 +4,16 @@
 '''
 
 
+import random
+
+
 class Node:
     '''
         Linked List node class
     '''
 
+    __slots__ = ('data', 'next')
+
     def __init__(self, data=None, next=None):
         '''
             Linked list node initialization
@@ -243,6 +248,90 @@ class SinglyLinkedList:
             node = next
         return self
 
+    def __len__(self):
+        '''
+            Returns the length of the linked list
+            O(1)
+        '''
+        return self.length
+
+    def __iter__(self):
+        '''
+            Lazily iterates over the values of the linked list
+            O(n) for a full pass
+
+            Yields:
+                Each value from head to tail
+        '''
+        current = self.head
+        while current:
+            yield current.data
+            current = current.next
+
+    def slice(self, start, stop=None):
+        '''
+            Lazily iterates over the values in positions [start, stop)
+            without copying the list
+            O(start + k) for k values
+
+            Parameters:
+                start [int]: the first position
+                stop [int]: the position to stop before (None for the end)
+
+            Yields:
+                Each value in the range
+        '''
+        if stop is None or stop > self.length:
+            stop = self.length
+        if start < 0 or start >= stop:
+            return
+        current = self.get(start)
+        for _ in range(stop - start):
+            yield current.data
+            current = current.next
+
+    def extend(self, items):
+        '''
+            Pushes several values, building their nodes into a chain
+            first and linking it to the tail once
+            O(k)
+
+            Parameters:
+                items [iterable]: the values to add in order
+
+            Returns:
+                The linked list instance
+        '''
+        chain = SinglyLinkedList()
+        for data in items:
+            chain.push(data)
+        return self.splice(chain)
+
+    def splice(self, other):
+        '''
+            Moves every node of another linked list onto the end of this
+            one by relinking, leaving the other list empty
+            O(1)
+
+            Parameters:
+                other [obj]: the SinglyLinkedList to append
+
+            Returns:
+                The linked list instance
+        '''
+        if other is self or other.head is None:
+            return self
+        if self.head is None:
+            self.head = other.head
+        else:
+            self.tail.next = other.head
+        self.tail = other.tail
+        self.length += other.length
+        other.head = None
+        other.tail = None
+        other.length = 0
+        return self
+
     def __repr__(self):
         '''
             Linked list print representation
@@ -257,3 +346,336 @@ class SinglyLinkedList:
             list.append(current.data)
             current = current.next
         return '{}'.format(list)
+
+
+class SkipNode:
+    '''
+        Indexed linked list node class with one forward link per level
+    '''
+
+    __slots__ = ('data', 'next', 'width')
+
+    def __init__(self, data, level):
+        '''
+            Indexed linked list node initialization
+            O(level)
+
+            Parameters:
+                data [int]: the value of the node
+                level [int]: the number of forward links
+        '''
+        self.data = data
+        self.next = [None] * level
+
+        # Number of positions skipped by each forward link
+        self.width = [0] * level
+
+    def __repr__(self):
+        '''
+            Print representation of the SkipNode class
+
+            Returns:
+                The string representation of the node
+        '''
+        return '{}'.format(self.data)
+
+
+class IndexedLinkedList:
+    '''
+        Linked list with a skip list index over positions
+
+        Each node links forward on one or more levels and every link
+        records how many positions it skips, so get, set, insert and
+        remove find a position in O(logn) expected time instead of
+        walking from the head. pop() is a remove at the last position.
+
+        The methods match SinglyLinkedList, but get, remove, pop and
+        shift return SkipNode objects: their next attribute is a list of
+        forward links, one per level, so read the value from data rather
+        than following next.
+    '''
+
+    maxLevel = 32
+
+    def __init__(self):
+        '''
+            Indexed linked list initialization
+            O(1)
+        '''
+        self.head = SkipNode(None, self.maxLevel)
+        self.head.width[0] = 1
+        self.level = 1
+        self.length = 0
+
+    def __len__(self):
+        '''
+            Returns the length of the linked list
+        '''
+        return self.length
+
+    def randomLevel(self):
+        '''
+            Picks the number of levels of a new node, each further
+            level with probability 1/2
+
+            Returns:
+                The level of the new node
+        '''
+        level = 1
+        while level < self.maxLevel and random.random() < 0.5:
+            level += 1
+        return level
+
+    def predecessors(self, index):
+        '''
+            Finds on every level the last node before a position
+            O(logn)
+
+            Parameters:
+                index [int]: the position to search for
+
+            Returns:
+                A tuple of the predecessor nodes and their positions,
+                both indexed by level (the head is at position -1)
+        '''
+        update = [self.head] * self.level
+        positions = [-1] * self.level
+        node = self.head
+        pos = -1
+        for lvl in range(self.level - 1, -1, -1):
+            while node.next[lvl] is not None and pos + node.width[lvl] < index:
+                pos += node.width[lvl]
+                node = node.next[lvl]
+            update[lvl] = node
+            positions[lvl] = pos
+        return update, positions
+
+    def get(self, index):
+        '''
+            Retrieves a node by its position in the linked list
+            O(logn)
+
+            Parameters:
+                index [int]: the index to get the value of
+
+            Returns:
+                The SkipNode at the specified index
+        '''
+        if index < 0 or index >= self.length:
+            return None
+        node = self.head
+        pos = -1
+        for lvl in range(self.level - 1, -1, -1):
+            while node.next[lvl] is not None and pos + node.width[lvl] <= index:
+                pos += node.width[lvl]
+                node = node.next[lvl]
+        return node
+
+    def set(self, index, data):
+        '''
+            Changes the value of a node at a specific position
+            O(logn)
+
+            Parameters:
+                index [int]: the index to set the value
+                data [int]: the new value of the node
+
+            Returns:
+                True or False regarding set success
+        '''
+        node = self.get(index)
+        if node:
+            node.data = data
+            return True
+        return False
+
+    def insert(self, index, data):
+        '''
+            Adds a node at a specific position in the linked list
+            O(logn)
+
+            Parameters:
+                index [int]: the index to insert the node to
+                data [int]: the data contained in the new node
+
+            Returns:
+                True or False regarding insert success
+        '''
+        if index < 0 or index > self.length:
+            return False
+        level = self.randomLevel()
+
+        # Links past the last node count the distance to position length
+        for lvl in range(self.level, level):
+            self.head.width[lvl] = self.length + 1
+        self.level = max(self.level, level)
+        update, positions = self.predecessors(index)
+
+        newNode = SkipNode(data, level)
+        for lvl in range(self.level):
+            prevNode = update[lvl]
+            if lvl < level:
+                following = positions[lvl] + prevNode.width[lvl]
+                newNode.next[lvl] = prevNode.next[lvl]
+                newNode.width[lvl] = following + 1 - index
+                prevNode.next[lvl] = newNode
+                prevNode.width[lvl] = index - positions[lvl]
+            else:
+                prevNode.width[lvl] += 1
+        self.length += 1
+        return True
+
+    def remove(self, index):
+        '''
+            Removes a node from a specific position of linked list
+            O(logn)
+
+            Parameters:
+                index [int]: the index to remove from
+
+            Returns:
+                The SkipNode that was removed
+        '''
+        if index < 0 or index >= self.length:
+            return None
+        update, positions = self.predecessors(index)
+        removedNode = update[0].next[0]
+        for lvl in range(self.level):
+            prevNode = update[lvl]
+            if prevNode.next[lvl] is removedNode:
+                prevNode.width[lvl] += removedNode.width[lvl] - 1
+                prevNode.next[lvl] = removedNode.next[lvl]
+            else:
+                prevNode.width[lvl] -= 1
+        while self.level > 1 and self.head.next[self.level - 1] is None:
+            self.level -= 1
+        self.length -= 1
+        return removedNode
+
+    def push(self, data):
+        '''
+            Pushes a new node to the end of the linked list
+            O(logn)
+
+            Parameters:
+                data [int]: the value of the node to add
+
+            Returns:
+                The linked list instance
+        '''
+        self.insert(self.length, data)
+        return self
+
+    def pop(self):
+        '''
+            Removes the last node of the linked list and returns it
+            O(logn)
+
+            Returns:
+                The removed SkipNode
+        '''
+        return self.remove(self.length - 1)
+
+    def shift(self):
+        '''
+            Removes a node from the beginning of the linked list
+            O(logn)
+
+            Returns:
+                The removed SkipNode
+        '''
+        return self.remove(0)
+
+    def unshift(self, data):
+        '''
+            Inserts a new node to the beginning of the linked list
+            O(logn)
+
+            Parameters:
+                data [int]: the value of the node to add
+
+            Returns:
+                The linked list instance
+        '''
+        self.insert(0, data)
+        return self
+
+    def reverse(self):
+        '''
+            Reverses the linked list in place, keeping each node and its
+            level and relinking every level in the new order
+            O(n) expected
+
+            Returns:
+                The reversed linked list instance
+        '''
+        nodes = []
+        current = self.head.next[0]
+        while current:
+            nodes.append(current)
+            current = current.next[0]
+
+        # The last node linked on each level and its position
+        last = [self.head] * self.level
+        lastPositions = [-1] * self.level
+        for pos in range(self.length):
+            node = nodes[self.length - 1 - pos]
+            for lvl in range(len(node.next)):
+                last[lvl].next[lvl] = node
+                last[lvl].width[lvl] = pos - lastPositions[lvl]
+                last[lvl] = node
+                lastPositions[lvl] = pos
+        for lvl in range(self.level):
+            last[lvl].next[lvl] = None
+            last[lvl].width[lvl] = self.length - lastPositions[lvl]
+        return self
+
+    def __iter__(self):
+        '''
+            Lazily iterates over the values of the linked list
+            O(n) for a full pass
+
+            Yields:
+                Each value from head to tail
+        '''
+        current = self.head.next[0]
+        while current:
+            yield current.data
+            current = current.next[0]
+
+    def slice(self, start, stop=None):
+        '''
+            Lazily iterates over the values in positions [start, stop)
+            without copying the list
+            O(logn + k) for k values
+
+            Parameters:
+                start [int]: the first position
+                stop [int]: the position to stop before (None for the end)
+
+            Yields:
+                Each value in the range
+        '''
+        if stop is None or stop > self.length:
+            stop = self.length
+        if start < 0 or start >= stop:
+            return
+        current = self.get(start)
+        for _ in range(stop - start):
+            yield current.data
+            current = current.next[0]
+
+    def __repr__(self):
+        '''
+            Linked list print representation
+            O(n)
+
+            Returns:
+                The string representation of the linked list
+        '''
+        list = []
+        current = self.head.next[0]
+        while current:
+            list.append(current.data)
+            current = current.next[0]
+        return '{}'.format(list)
@@ -4,11 +4,16 @@
 '''
 
 
+import time
+
+
 class Node:
     '''
         Node class for the stack structure
     '''
 
+    __slots__ = ('data', 'next')
+
     def __init__(self, data):
         '''
             Initialization of the node class
@@ -88,6 +93,68 @@ class Stack:
         self.size -= 1
         return temp.data
 
+    def __len__(self):
+        '''
+            Returns the size of the stack
+            O(1)
+        '''
+        return self.size
+
+    def __iter__(self):
+        '''
+            Lazily iterates over the values of the stack
+            O(n) for a full pass
+
+            Yields:
+                Each value from the top of the stack down
+        '''
+        current = self.first
+        while current:
+            yield current.data
+            current = current.next
+
+    def extend(self, items):
+        '''
+            Pushes several values in order, so the last one ends up on
+            top, building their nodes into a chain first and linking it
+            onto the stack once
+            O(k)
+
+            Parameters:
+                items [iterable]: the values to push
+
+            Returns:
+                The size of the stack
+        '''
+        chain = Stack()
+        for data in items:
+            chain.push(data)
+        return self.splice(chain)
+
+    def splice(self, other):
+        '''
+            Moves every node of another stack on top of this one by
+            relinking, leaving the other stack empty
+            O(1)
+
+            Parameters:
+                other [obj]: the Stack to place on top
+
+            Returns:
+                The size of the stack
+        '''
+        if other is self or other.first is None:
+            return self.size
+        other.last.next = self.first
+        if self.first is None:
+            self.last = other.last
+        self.first = other.first
+        self.size += other.size
+        other.first = None
+        other.last = None
+        other.size = 0
+        return self.size
+
     def __repr__(self):
         '''
             Print representation of the stack class
@@ -101,3 +168,144 @@ class Stack:
             list.append(current.data)
             current = current.next
         return '{}'.format(list)
+
+
+class ArrayStack:
+    '''
+        Stack class data structure backed by a Python list, which is an
+        amortized growable array, so push and pop do not allocate a
+        node per value
+    '''
+
+    def __init__(self):
+        '''
+            Initialization of stack class
+            O(1)
+        '''
+        self.values = []
+        self.size = 0
+
+    def push(self, data):
+        '''
+            Pushes a value onto the top of the stack
+            O(1) amortized
+
+            Parameters:
+                data [int]: the value to add to the stack
+
+            Returns:
+                The size of the stack
+        '''
+        self.values.append(data)
+        self.size += 1
+        return self.size
+
+    def pop(self):
+        '''
+            Pops off the top value of the stack and returns it
+            O(1)
+
+            Returns:
+                The removed value from the stack
+        '''
+        if self.size == 0:
+            return None
+        self.size -= 1
+        return self.values.pop()
+
+    def extend(self, items):
+        '''
+            Pushes several values in order, so the last one ends up on
+            top of the stack
+            O(k)
+
+            Parameters:
+                items [iterable]: the values to push
+
+            Returns:
+                The size of the stack
+        '''
+        self.values.extend(items)
+        self.size = len(self.values)
+        return self.size
+
+    def drain(self, n):
+        '''
+            Pops up to n values off the top of the stack
+            O(k)
+
+            Parameters:
+                n [int]: the most values to remove
+
+            Returns:
+                A list of the values removed, top of the stack first
+        '''
+        count = min(n, self.size)
+        if count <= 0:
+            return []
+        drained = self.values[-count:]
+        del self.values[-count:]
+        drained.reverse()
+        self.size -= count
+        return drained
+
+    def __repr__(self):
+        '''
+            Print representation of the stack class
+
+            Returns:
+                The string representation of the stack, top first
+        '''
+        return '{}'.format(self.values[::-1])
+
+
+# Benchmarks
+# Returns its measurements in a dictionary, eg. from the repository
+# root:
+#   python -c "from Data_Structures.stack import *;
+#              print(benchmarkArrayStack())"
+def benchmarkArrayStack(n=300000, batch=1000, repeats=3):
+    '''
+        Compares the throughput of the linked Stack and ArrayStack
+
+        Parameters:
+            n [int]: the number of values pushed and then popped
+            batch [int]: the drain size for the bulk measurement
+            repeats [int]: the number of runs (the best one is kept)
+
+        Returns:
+            A dictionary with the millions of single operations per
+            second of Stack and ArrayStack, and the millions of values
+            per second of ArrayStack.extend followed by drain(batch)
+    '''
+    values = list(range(n))
+
+    def singleOperations(stack):
+        '''
+            Pushes then pops every value one at a time
+        '''
+        started = time.perf_counter()
+        for value in values:
+            stack.push(value)
+        for _ in values:
+            stack.pop()
+        return 2 * n / (time.perf_counter() - started) / 1e6
+
+    def bulkOperations():
+        '''
+            Extends with every value then drains them in batches
+        '''
+        stack = ArrayStack()
+        started = time.perf_counter()
+        stack.extend(values)
+        while len(stack.drain(batch)):
+            pass
+        return 2 * n / (time.perf_counter() - started) / 1e6
+
+    return {
+        "Stack": max(singleOperations(Stack()) for _ in range(repeats)),
+        "ArrayStack": max(singleOperations(ArrayStack())
+                          for _ in range(repeats)),
+        "ArrayStack extend + drain": max(bulkOperations()
+                                         for _ in range(repeats))
+    }